@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Load generator and latency benchmark for the faucet backend.
+
+Drives POST /api/request (optionally the ?async=1 job mode) and reports
+latency percentiles, a latency histogram, throughput and an error breakdown.
+
+Two load models:
+- closed loop: N workers, each sends its next request as soon as the previous
+  one completes (measures capacity at a fixed concurrency).
+- open loop: requests arrive at a fixed rate regardless of how fast the
+  backend answers (Poisson or constant arrivals). Latency is measured from the
+  scheduled arrival time, so a backlog shows up as latency instead of being
+  hidden by the generator slowing down.
+
+To run offline, start the backend with FULLNODE_STUB=1 (a fake fullnode with
+tunable latency behind server.js's client; see ../README.md) and raise
+IP_RATE_LIMIT_MAX, since every generated request comes from one IP.
+
+Examples:
+    python3 loadtest.py run --url http://localhost:8787 --mode closed --concurrency 32 --duration 30
+    python3 loadtest.py run --mode open --rate 200 --duration 30 --json baseline.json
+
+Standard library only.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import sys
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+DEFAULT_URL = 'http://localhost:8787'
+DEFAULT_AMOUNT = 1_000_000  # 1 USDC in atomic units
+
+
+class HttpConnection:
+    """Minimal keep-alive HTTP/1.1 client connection on asyncio streams."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method, path, body=None):
+        """Send one request and return (status, body bytes). Reconnects as needed."""
+        if self.writer is None or self.writer.is_closing():
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+        payload = json.dumps(body).encode() if body is not None else b''
+        head = (
+            f'{method} {path} HTTP/1.1\r\n'
+            f'Host: {self.host}:{self.port}\r\n'
+            'Content-Type: application/json\r\n'
+            f'Content-Length: {len(payload)}\r\n'
+            '\r\n'
+        )
+        try:
+            self.writer.write(head.encode() + payload)
+            await self.writer.drain()
+            return await self._read_response()
+        except Exception:
+            self.close()
+            raise
+
+    async def _read_response(self):
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError('connection closed by server')
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            data = b''.join(chunks)
+        else:
+            data = await self.reader.readexactly(int(headers.get('content-length', 0)))
+
+        if headers.get('connection', '').lower() == 'close':
+            self.close()
+        return status, data
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+class ConnectionPool:
+    """Reuses idle connections; opens new ones on demand (open-loop mode)."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.idle = []
+
+    async def request(self, method, path, body=None):
+        conn = self.idle.pop() if self.idle else HttpConnection(self.host, self.port)
+        try:
+            result = await conn.request(method, path, body)
+        except Exception:
+            conn.close()
+            raise
+        self.idle.append(conn)
+        return result
+
+    def close(self):
+        for conn in self.idle:
+            conn.close()
+        self.idle.clear()
+
+
+def make_recipients(count, seed):
+    """Deterministic spread of random 32-byte Sui addresses."""
+    rng = random.Random(seed)
+    return [f'0x{rng.getrandbits(256):064x}' for _ in range(count)]
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def classify_error(status, data):
+    """Bucket a failed response into a short, stable error key."""
+    text = data.decode('utf-8', 'replace')
+    try:
+        parsed = json.loads(text)
+        if isinstance(parsed, dict):
+            text = str(parsed.get('error') or parsed.get('message') or text)
+    except ValueError:
+        pass
+    if 'MoveAbort' in text:
+        # Same formats as backend/src/aborts.js: "..., 1) in command 0" or "code 1"
+        match = re.search(r'\},\s*(\d+)\)', text) or re.search(r'code:?\s*(\d+)', text, re.I)
+        return f'HTTP {status}: MoveAbort' + (f' code {match.group(1)}' if match else '')
+    return f'HTTP {status}: {text.strip()[:60]}'
+
+
+class Stats:
+    """Collects per-request outcomes for the final report."""
+
+    def __init__(self):
+        self.latencies_ms = []
+        self.errors = Counter()
+        self.statuses = Counter()
+        self.dropped = 0
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def record(self, latency_ms, status=None, error=None):
+        if status is not None:
+            self.statuses[status] += 1
+        if error is None:
+            self.latencies_ms.append(latency_ms)
+        else:
+            self.errors[error] += 1
+
+    def summary(self):
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        lat = sorted(self.latencies_ms)
+        ok = len(lat)
+        failed = sum(self.errors.values())
+        return {
+            'elapsed_s': round(elapsed, 3),
+            'requests': ok + failed,
+            'succeeded': ok,
+            'failed': failed,
+            'dropped': self.dropped,
+            'throughput_rps': round(ok / elapsed, 2) if elapsed else 0.0,
+            'latency_ms': {
+                'min': round(lat[0], 2) if lat else 0.0,
+                'mean': round(sum(lat) / ok, 2) if ok else 0.0,
+                'p50': round(percentile(lat, 50), 2),
+                'p95': round(percentile(lat, 95), 2),
+                'p99': round(percentile(lat, 99), 2),
+                'max': round(lat[-1], 2) if lat else 0.0,
+            },
+            'statuses': {str(k): v for k, v in sorted(self.statuses.items())},
+            'errors': dict(self.errors.most_common()),
+        }
+
+
+def histogram(values_ms, width=50):
+    """Log2-bucketed ASCII latency histogram lines."""
+    if not values_ms:
+        return []
+    buckets = Counter(max(0, math.ceil(math.log2(max(v, 1)))) for v in values_ms)
+    peak = max(buckets.values())
+    lines = []
+    for exp in range(min(buckets), max(buckets) + 1):
+        n = buckets.get(exp, 0)
+        lo = 0 if exp == 0 else 2 ** (exp - 1)
+        bar = '#' * max(1 if n else 0, round(n / peak * width))
+        lines.append(f'  {lo:>7}-{2 ** exp:<7} ms | {bar} {n}')
+    return lines
+
+
+def print_report(summary, values_ms):
+    lat = summary['latency_ms']
+    print(f"\nRequests: {summary['requests']}  ok: {summary['succeeded']}  "
+          f"failed: {summary['failed']}  dropped: {summary['dropped']}")
+    print(f"Elapsed: {summary['elapsed_s']}s  throughput: {summary['throughput_rps']} req/s")
+    print(f"Latency ms: min {lat['min']}  mean {lat['mean']}  p50 {lat['p50']}  "
+          f"p95 {lat['p95']}  p99 {lat['p99']}  max {lat['max']}")
+    print('\nLatency histogram:')
+    for line in histogram(values_ms):
+        print(line)
+    if summary['errors']:
+        print('\nErrors:')
+        for key, count in summary['errors'].items():
+            print(f'  {count:>7}  {key}')
+
+
+async def one_request(client, args, recipient, scheduled, stats):
+    """Issue one faucet request (and follow its job in async mode); record the outcome."""
+    path = '/api/request?async=1' if args.use_async else '/api/request'
+    try:
+        status, data = await client.request('POST', path, {'recipient': recipient, 'amount': args.amount})
+        if args.use_async and status == 202:
+            job_id = json.loads(data)['jobId']
+            while True:
+                await asyncio.sleep(args.poll_ms / 1000)
+                status, data = await client.request('GET', f'/api/jobs/{job_id}')
+                job = json.loads(data) if status == 200 else {}
+                if job.get('status') == 'succeeded':
+                    break
+                if job.get('status') == 'failed' or status != 200:
+                    status = status if status != 200 else 500
+                    data = json.dumps({'error': job.get('error', 'job failed')}).encode()
+                    break
+    except Exception as e:
+        stats.record(0, error=f'client: {type(e).__name__}: {e}'[:80])
+        return
+    latency_ms = (time.perf_counter() - scheduled) * 1000
+    error = None if 200 <= status < 300 else classify_error(status, data)
+    stats.record(latency_ms, status, error)
+
+
+async def closed_loop(args, host, port, recipients, stats):
+    deadline = time.perf_counter() + args.duration
+    budget = iter(range(args.requests)) if args.requests else None
+
+    async def worker(idx):
+        conn = HttpConnection(host, port)
+        n = idx
+        try:
+            while time.perf_counter() < deadline:
+                if budget is not None and next(budget, None) is None:
+                    return
+                recipient = recipients[n % len(recipients)]
+                n += args.concurrency
+                await one_request(conn, args, recipient, time.perf_counter(), stats)
+        finally:
+            conn.close()
+
+    await asyncio.gather(*(worker(i) for i in range(args.concurrency)))
+
+
+async def open_loop(args, host, port, recipients, stats):
+    pool = ConnectionPool(host, port)
+    rng = random.Random(args.seed)
+    inflight = set()
+    start = time.perf_counter()
+    next_at = start
+    sent = 0
+    while next_at - start < args.duration and (not args.requests or sent < args.requests):
+        delay = next_at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(inflight) >= args.max_inflight:
+            stats.dropped += 1
+        else:
+            recipient = recipients[sent % len(recipients)]
+            task = asyncio.create_task(one_request(pool, args, recipient, next_at, stats))
+            inflight.add(task)
+            task.add_done_callback(inflight.discard)
+        sent += 1
+        gap = rng.expovariate(args.rate) if args.arrivals == 'poisson' else 1 / args.rate
+        next_at += gap
+    if inflight:
+        await asyncio.gather(*inflight)
+    pool.close()
+
+
+async def run_load(args):
+    url = urlsplit(args.url)
+    host, port = url.hostname or 'localhost', url.port or 80
+    recipients = make_recipients(args.recipients, args.seed)
+    stats = Stats()
+
+    print(f'Target: {args.url}  mode: {args.mode}'
+          f"{'  (async jobs)' if args.use_async else ''}  duration: {args.duration}s")
+    if args.mode == 'closed':
+        print(f'Concurrency: {args.concurrency}  recipients: {len(recipients)}')
+        await closed_loop(args, host, port, recipients, stats)
+    else:
+        print(f'Arrival rate: {args.rate}/s ({args.arrivals})  max in-flight: {args.max_inflight}  '
+              f'recipients: {len(recipients)}')
+        await open_loop(args, host, port, recipients, stats)
+    stats.finished = time.perf_counter()
+
+    summary = stats.summary()
+    print_report(summary, stats.latencies_ms)
+    if args.json:
+        summary['config'] = {k: v for k, v in vars(args).items() if k != 'func'}
+        with open(args.json, 'w') as f:
+            json.dump(summary, f, indent=2)
+        print(f'\nReport saved: {args.json}')
+    return 0 if summary['succeeded'] else 1
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Faucet backend load generator.')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help='Generate load against /api/request.')
+    run.add_argument('--url', default=DEFAULT_URL)
+    run.add_argument('--mode', choices=['closed', 'open'], default='closed')
+    run.add_argument('--concurrency', type=int, default=16, help='closed loop: parallel workers')
+    run.add_argument('--rate', type=float, default=50.0, help='open loop: arrivals per second')
+    run.add_argument('--arrivals', choices=['poisson', 'constant'], default='poisson')
+    run.add_argument('--max-inflight', type=int, default=10_000,
+                     help='open loop: arrivals beyond this are counted as dropped')
+    run.add_argument('--duration', type=float, default=30.0, help='seconds')
+    run.add_argument('--requests', type=int, default=0, help='stop after this many (0 = no limit)')
+    run.add_argument('--recipients', type=int, default=1000, help='distinct recipient addresses')
+    run.add_argument('--amount', type=int, default=DEFAULT_AMOUNT, help='atomic units per request')
+    run.add_argument('--async', dest='use_async', action='store_true',
+                     help='use ?async=1 and poll the job until it finishes')
+    run.add_argument('--poll-ms', type=int, default=100)
+    run.add_argument('--seed', type=int, default=1)
+    run.add_argument('--json', help='write the summary report to this file')
+    run.set_defaults(func=run_load)
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    try:
+        return asyncio.run(args.func(args)) or 0
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,29 @@
+// Recognise Move aborts raised by `stablecoin::faucet` in execution errors.
+// Codes must match the `// === Errors ===` constants in faucet.move.
+export const FAUCET_ABORT_CODES = {
+  1: "ERateLimitExceeded",
+  4: "ENotOwner",
+  5: "EInvalidAmount",
+  6: "EInvalidTreasury",
+};
+
+/**
+ * Extract `{ module, code }` from a MoveAbort error, e.g.
+ * `MoveAbort(MoveLocation { module: ModuleId { ..., name: Identifier("faucet") }, ... }, 1) in command 0`.
+ * Returns null when the error is not a Move abort.
+ */
+export function parseMoveAbort(err) {
+  const msg = err?.message || String(err ?? "");
+  if (!msg.includes("MoveAbort")) return null;
+  const code = /\},\s*(\d+)\)/.exec(msg)?.[1] ?? /code:?\s*(\d+)/i.exec(msg)?.[1];
+  if (code === undefined) return null;
+  const module = /Identifier\("(\w+)"\)/.exec(msg)?.[1] ?? null;
+  return { module, code: Number(code) };
+}
+
+/** Name of the faucet error constant behind `err`, or null. */
+export function faucetAbortName(err) {
+  const abort = parseMoveAbort(err);
+  if (!abort || (abort.module && abort.module !== "faucet")) return null;
+  return FAUCET_ABORT_CODES[abort.code] ?? null;
+}
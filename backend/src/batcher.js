@@ -0,0 +1,136 @@
+// Micro-batching queue for faucet mints.
+//
+// Concurrent /api/request calls are collected for up to `maxWaitMs` (or until
+// `maxBatchSize` entries are pending) and executed as a single programmable
+// transaction with one `faucet::request_for` command per entry. Every waiting
+// caller receives the same digest.
+//
+// Batches run one at a time: all of them are signed by the same server key and
+// pay gas from the same coins, so overlapping transactions would only contend
+// for the gas object. Requests that arrive while a batch is executing simply
+// join the next one.
+//
+// A failed batch is only retried without the offending entry when the
+// transaction executed, failed on chain (so nothing was minted), and the
+// failure is a Move abort in a command that can be blamed on that entry. Every
+// other failure rejects the whole batch at once:
+//   - errors before submission (build, sign, fullnode unreachable) and on-chain
+//     failures that no entry caused (gas, budget, EInvalidTreasury, ...) would
+//     only repeat for every subset, each retry costing a serialized
+//     transaction (and gas, since the template skips the dry run);
+//   - errors after submission, such as a gRPC deadline or UNAVAILABLE, may hide
+//     a transaction that landed anyway, so retrying could mint twice.
+// At most `maxRetries` retries are made per batch.
+import { faucetAbortName, parseMoveAbort } from "./aborts.js";
+
+// Faucet aborts that every command in the transaction would hit alike
+const BATCH_WIDE_ABORTS = new Set(["EInvalidTreasury", "ENotOwner"]);
+
+// Sui reports aborts as e.g. "MoveAbort(MoveLocation { ... }, 1) in command 3".
+function failedCommandIndex(err) {
+  const m = /in command (\d+)/.exec(err?.message || String(err));
+  return m ? Number(m[1]) : null;
+}
+
+// Index of the entry an executed transaction's failure can be blamed on, or null.
+function blamedEntry(err, size) {
+  const idx = failedCommandIndex(err);
+  if (err.digest === undefined || idx === null || idx >= size) return null;
+  if (!parseMoveAbort(err) || BATCH_WIDE_ABORTS.has(faucetAbortName(err))) {
+    return null;
+  }
+  return idx;
+}
+
+/**
+ * Thrown by `execute` when no mint in the batch took effect: the transaction
+ * was never submitted, or it executed and failed (a failed transaction's
+ * commands are all reverted). `digest` is set for executed transactions.
+ */
+export class NotMintedError extends Error {
+  constructor(cause, { digest } = {}) {
+    super(cause?.message || String(cause), { cause });
+    this.name = "NotMintedError";
+    this.digest = digest;
+  }
+}
+
+export class RequestBatcher {
+  #pending = [];
+  #timer = null;
+  #draining = false;
+
+  /**
+   * @param {object} opts
+   * @param {number} opts.maxBatchSize  max commands per transaction
+   * @param {number} opts.maxWaitMs     max time the first entry waits for company
+   * @param {number} [opts.maxRetries]  max re-executions of one batch after
+   *                                    dropping blamed entries (default 3)
+   * @param {(entries: any[]) => Promise<string>} opts.execute
+   *   builds, signs and executes one transaction for `entries`; resolves with
+   *   the digest, throws `NotMintedError` when nothing was minted, or any
+   *   other error when the outcome is unknown.
+   */
+  constructor({ maxBatchSize, maxWaitMs, maxRetries = 3, execute }) {
+    this.maxBatchSize = Math.max(1, maxBatchSize);
+    this.maxWaitMs = Math.max(0, maxWaitMs);
+    this.maxRetries = Math.max(0, maxRetries);
+    this.execute = execute;
+  }
+
+  get pending() {
+    return this.#pending.length;
+  }
+
+  /** Queue one mint; resolves with the digest of the transaction that included it. */
+  submit(entry) {
+    return new Promise((resolve, reject) => {
+      this.#pending.push({ entry, resolve, reject });
+      if (this.#draining) return;
+      if (this.#pending.length >= this.maxBatchSize) {
+        this.#drain();
+      } else if (!this.#timer) {
+        this.#timer = setTimeout(() => this.#drain(), this.maxWaitMs);
+      }
+    });
+  }
+
+  async #drain() {
+    clearTimeout(this.#timer);
+    this.#timer = null;
+    if (this.#draining) return;
+    this.#draining = true;
+    try {
+      while (this.#pending.length) {
+        await this.#run(this.#pending.splice(0, this.maxBatchSize));
+      }
+    } finally {
+      this.#draining = false;
+    }
+  }
+
+  // Execute `batch`; when the chain blames one entry, reject it (and, for
+  // ERateLimitExceeded, every later one) and retry the rest.
+  async #run(batch, retriesLeft = this.maxRetries) {
+    if (!batch.length) return;
+    try {
+      const digest = await this.execute(batch.map((item) => item.entry));
+      for (const item of batch) item.resolve(digest);
+    } catch (e) {
+      const idx = e instanceof NotMintedError ? blamedEntry(e, batch.length) : null;
+      if (idx === null || batch.length === 1 || retriesLeft === 0) {
+        for (const item of batch) item.reject(e);
+        return;
+      }
+      // Once the shared budget is spent, every later request_for aborts too
+      const limitHit = faucetAbortName(e) === "ERateLimitExceeded";
+      for (const item of limitHit ? batch.slice(idx) : [batch[idx]]) {
+        item.reject(e);
+      }
+      await this.#run(
+        limitHit ? batch.slice(0, idx) : batch.filter((_, i) => i !== idx),
+        retriesLeft - 1,
+      );
+    }
+  }
+}
@@ -0,0 +1,89 @@
+// Bounded job queue for asynchronous /api/request handling.
+//
+// A job is accepted immediately and executed by one of `workers` workers.
+// Callers follow it via GET /api/jobs/:id or its Server-Sent Events stream.
+// When every worker is busy and `maxQueued` jobs are already waiting,
+// `enqueue` returns null so the route can answer with a queue-full response
+// instead of piling up work.
+import { EventEmitter } from "events";
+import { randomUUID } from "crypto";
+
+const TERMINAL = new Set(["succeeded", "failed"]);
+
+export class JobQueue extends EventEmitter {
+  #jobs = new Map();
+  #waiting = [];
+  #running = 0;
+
+  /**
+   * @param {object} opts
+   * @param {number} opts.workers    jobs executed concurrently
+   * @param {number} opts.maxQueued  jobs allowed to wait for a worker
+   * @param {number} opts.ttlMs      how long finished jobs stay queryable
+   */
+  constructor({ workers, maxQueued, ttlMs }) {
+    super();
+    this.setMaxListeners(0); // one listener per open SSE stream
+    this.workers = Math.max(1, workers);
+    this.maxQueued = Math.max(0, maxQueued);
+    this.ttlMs = ttlMs;
+  }
+
+  static isTerminal(job) {
+    return TERMINAL.has(job.status);
+  }
+
+  get depth() {
+    return this.#waiting.length;
+  }
+
+  get(id) {
+    return this.#jobs.get(id) || null;
+  }
+
+  /**
+   * Queue `run()`; resolves the job with its `{ digest }`. Returns null when
+   * every worker is busy and `maxQueued` jobs are already waiting.
+   */
+  enqueue(run) {
+    if (
+      this.#running >= this.workers &&
+      this.#waiting.length >= this.maxQueued
+    ) {
+      return null;
+    }
+    const job = { id: randomUUID(), status: "queued", createdAt: Date.now() };
+    this.#jobs.set(job.id, job);
+    this.#waiting.push({ job, run });
+    this.#pump();
+    return job;
+  }
+
+  #update(job, fields) {
+    Object.assign(job, fields, { updatedAt: Date.now() });
+    this.emit(job.id, job);
+    if (JobQueue.isTerminal(job)) {
+      setTimeout(() => this.#jobs.delete(job.id), this.ttlMs).unref();
+    }
+  }
+
+  #pump() {
+    while (this.#running < this.workers && this.#waiting.length) {
+      const { job, run } = this.#waiting.shift();
+      this.#running += 1;
+      this.#update(job, { status: "running" });
+      run()
+        .then(({ digest }) => this.#update(job, { status: "succeeded", digest }))
+        .catch((e) =>
+          this.#update(job, {
+            status: "failed",
+            error: e?.message || "Server error",
+          }),
+        )
+        .finally(() => {
+          this.#running -= 1;
+          this.#pump();
+        });
+    }
+  }
+}
@@ -0,0 +1,163 @@
+// Minimal Prometheus metrics (text exposition format 0.0.4).
+//
+// Only what the faucet needs: labelled counters, gauges and histograms.
+
+function labelKey(labels) {
+  return JSON.stringify(Object.entries(labels || {}).sort());
+}
+
+// Label values escape backslash, double quote and newline (as `\n`)
+function escapeLabelValue(value) {
+  return String(value).replace(/[\\"\n]/g, (c) => (c === "\n" ? "\\n" : `\\${c}`));
+}
+
+function formatLabels(entries, extra = []) {
+  const all = [...entries, ...extra];
+  if (!all.length) return "";
+  const body = all
+    .map(([k, v]) => `${k}="${escapeLabelValue(v)}"`)
+    .join(",");
+  return `{${body}}`;
+}
+
+class Metric {
+  constructor(name, help, type) {
+    this.name = name;
+    this.help = help;
+    this.type = type;
+    this.series = new Map();
+  }
+
+  _series(labels, init) {
+    const key = labelKey(labels);
+    let s = this.series.get(key);
+    if (!s) {
+      s = { labels: Object.entries(labels || {}).sort(), ...init() };
+      this.series.set(key, s);
+    }
+    return s;
+  }
+
+  render() {
+    return [`# HELP ${this.name} ${this.help}`, `# TYPE ${this.name} ${this.type}`];
+  }
+}
+
+export class Counter extends Metric {
+  constructor(name, help) {
+    super(name, help, "counter");
+  }
+
+  inc(labels, value = 1) {
+    this._series(labels, () => ({ value: 0 })).value += value;
+  }
+
+  render() {
+    const lines = super.render();
+    for (const s of this.series.values()) {
+      lines.push(`${this.name}${formatLabels(s.labels)} ${s.value}`);
+    }
+    return lines;
+  }
+}
+
+export class Gauge extends Metric {
+  /** `collect` (optional) is called at scrape time and returns the value. */
+  constructor(name, help, collect) {
+    super(name, help, "gauge");
+    this.collect = collect;
+  }
+
+  set(value, labels) {
+    this._series(labels, () => ({ value: 0 })).value = value;
+  }
+
+  inc(labels, value = 1) {
+    this._series(labels, () => ({ value: 0 })).value += value;
+  }
+
+  dec(labels, value = 1) {
+    this.inc(labels, -value);
+  }
+
+  render() {
+    if (this.collect) this.set(this.collect());
+    const lines = super.render();
+    for (const s of this.series.values()) {
+      lines.push(`${this.name}${formatLabels(s.labels)} ${s.value}`);
+    }
+    return lines;
+  }
+}
+
+export class Histogram extends Metric {
+  constructor(name, help, buckets) {
+    super(name, help, "histogram");
+    this.buckets = [...buckets].sort((a, b) => a - b);
+  }
+
+  observe(labels, value) {
+    const s = this._series(labels, () => ({
+      counts: new Array(this.buckets.length).fill(0),
+      sum: 0,
+      count: 0,
+    }));
+    const idx = this.buckets.findIndex((b) => value <= b);
+    if (idx >= 0) s.counts[idx] += 1;
+    s.sum += value;
+    s.count += 1;
+  }
+
+  /** Start a timer; call the returned function to observe elapsed seconds. */
+  startTimer(labels) {
+    const start = process.hrtime.bigint();
+    return () =>
+      this.observe(labels, Number(process.hrtime.bigint() - start) / 1e9);
+  }
+
+  render() {
+    const lines = super.render();
+    for (const s of this.series.values()) {
+      let cumulative = 0;
+      this.buckets.forEach((b, i) => {
+        cumulative += s.counts[i];
+        lines.push(
+          `${this.name}_bucket${formatLabels(s.labels, [["le", b]])} ${cumulative}`,
+        );
+      });
+      lines.push(
+        `${this.name}_bucket${formatLabels(s.labels, [["le", "+Inf"]])} ${s.count}`,
+      );
+      lines.push(`${this.name}_sum${formatLabels(s.labels)} ${s.sum}`);
+      lines.push(`${this.name}_count${formatLabels(s.labels)} ${s.count}`);
+    }
+    return lines;
+  }
+}
+
+export class Registry {
+  #metrics = [];
+
+  register(metric) {
+    this.#metrics.push(metric);
+    return metric;
+  }
+
+  counter(name, help) {
+    return this.register(new Counter(name, help));
+  }
+
+  gauge(name, help, collect) {
+    return this.register(new Gauge(name, help, collect));
+  }
+
+  histogram(name, help, buckets) {
+    return this.register(new Histogram(name, help, buckets));
+  }
+
+  render() {
+    return this.#metrics.flatMap((m) => m.render()).join("\n") + "\n";
+  }
+}
+
+export const CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8";
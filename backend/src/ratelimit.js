@@ -0,0 +1,108 @@
+// Off-chain rate limiting for /api/request.
+//
+// `faucet.move` enforces its limits only after the transaction reaches a
+// fullnode. Requests that are bound to abort are rejected here instead, in
+// memory, before any transaction is built.
+
+// Defaults mirror the constants in packages/stablecoin/sources/faucet.move.
+export const MAX_REQUEST_AMOUNT = 50_000_000 * 1_000_000;
+export const RATE_LIMIT_PERIOD_MS = 3_600_000;
+export const MAX_REQUESTS_PER_PERIOD = 1000;
+
+/**
+ * Mirror of `faucet::mint_with_rate_limit` for a single sender.
+ *
+ * The contract keys its limit on `ctx.sender()`, which for this backend is
+ * always the server signer, so every mint counts against one shared budget.
+ * The counter resets only once a full period has passed since the *last*
+ * request; this mirrors that rule rather than a true sliding window.
+ */
+export class OnChainLimitMirror {
+  #last = 0;
+  #count = 0;
+  #exhausted = false;
+
+  constructor({
+    periodMs = RATE_LIMIT_PERIOD_MS,
+    maxPerPeriod = MAX_REQUESTS_PER_PERIOD,
+    maxAmount = MAX_REQUEST_AMOUNT,
+  } = {}) {
+    this.periodMs = periodMs;
+    this.maxPerPeriod = maxPerPeriod;
+    this.maxAmount = maxAmount;
+  }
+
+  #effectiveCount(now) {
+    return now - this.#last >= this.periodMs ? 0 : this.#count;
+  }
+
+  /** The amount is a u64: a positive integer up to the contract's maximum. */
+  validAmount(amount) {
+    return Number.isSafeInteger(amount) && amount > 0 && amount <= this.maxAmount;
+  }
+
+  /** Count one mint if the contract would accept it; false means it would abort. */
+  tryReserve(now = Date.now()) {
+    const count = this.#effectiveCount(now);
+    if (count === 0) this.#exhausted = false;
+    if (count >= this.maxPerPeriod) return false;
+    this.#count = count + 1;
+    this.#last = now;
+    return true;
+  }
+
+  /**
+   * Undo a reservation whose transaction never executed. Ignored once the
+   * chain has reported the budget spent: the count is then the chain's, not
+   * ours, and releasing would reopen the pre-check too early.
+   */
+  release() {
+    if (this.#exhausted) return;
+    if (this.#count > 0) this.#count -= 1;
+  }
+
+  /** Sync with the chain after an `ERateLimitExceeded` abort we did not predict. */
+  exhaust(now = Date.now()) {
+    this.#count = this.maxPerPeriod;
+    this.#last = now;
+    this.#exhausted = true;
+  }
+
+  retryAfterMs(now = Date.now()) {
+    return Math.max(0, this.#last + this.periodMs - now);
+  }
+}
+
+/**
+ * Per-key sliding-window limiter (e.g. per client IP).
+ *
+ * Keeps the timestamps of the last `max` hits per key. A Map is used as the
+ * LRU: touched keys are re-inserted at the end, and the oldest keys are
+ * evicted once `maxKeys` is exceeded, so memory stays bounded.
+ */
+export class SlidingWindowLimiter {
+  #hits = new Map();
+
+  constructor({ windowMs, max, maxKeys = 10_000 }) {
+    this.windowMs = windowMs;
+    this.max = max;
+    this.maxKeys = maxKeys;
+  }
+
+  /** Returns 0 if the hit is allowed (and records it), else ms until a slot frees up. */
+  hit(key, now = Date.now()) {
+    const cutoff = now - this.windowMs;
+    const stamps = (this.#hits.get(key) || []).filter((t) => t > cutoff);
+    this.#hits.delete(key);
+    if (stamps.length >= this.max) {
+      this.#hits.set(key, stamps);
+      return stamps[0] - cutoff;
+    }
+    stamps.push(now);
+    this.#hits.set(key, stamps);
+    while (this.#hits.size > this.maxKeys) {
+      this.#hits.delete(this.#hits.keys().next().value);
+    }
+    return 0;
+  }
+}
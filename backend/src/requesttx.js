@@ -0,0 +1,48 @@
+// Builds the batch mint transaction: one `faucet::request_for` command per
+// entry, all in a single programmable transaction.
+//
+// The transaction is built with `tx.build()` and executed separately (so each
+// phase can be timed), which unlike `signAndExecuteTransaction` does not take
+// the sender from the signer. The sender is therefore always set here; with
+// the template enabled `MintTemplate.prepare` sets the same address again.
+
+/**
+ * @param {import("@mysten/sui/transactions").Transaction} tx  empty transaction
+ * @param {{ recipient: string, amount: number }[]} entries
+ * @param {object} opts
+ * @param {string} opts.sender             server signer address (pays gas)
+ * @param {import("./txtemplate.js").MintTemplate | null} opts.template
+ *   pre-resolved inputs, or null to let the SDK resolve objects, gas and budget
+ * @param {{ faucet: string, treasury: string, clock: string }} opts.objects
+ * @param {string} opts.stablecoinPackage
+ * @param {string} opts.coinType            e.g. `0x…::usdc::USDC`
+ */
+export async function buildRequestTransaction(
+  tx,
+  entries,
+  { sender, template, objects, stablecoinPackage, coinType },
+) {
+  tx.setSenderIfNotSet(sender);
+  const inputs = template
+    ? await template.prepare(tx, entries.length)
+    : {
+        faucet: tx.object(objects.faucet),
+        treasury: tx.object(objects.treasury),
+        clock: tx.object(objects.clock),
+      };
+  for (const { recipient, amount } of entries) {
+    // Circle stablecoin faucet path (generic over T=USDC)
+    tx.moveCall({
+      target: `${stablecoinPackage}::faucet::request_for`,
+      typeArguments: [coinType],
+      arguments: [
+        inputs.faucet,
+        inputs.treasury,
+        tx.pure.address(recipient),
+        tx.pure.u64(amount),
+        inputs.clock,
+      ],
+    });
+  }
+  return tx;
+}
@@ -5,9 +5,27 @@ import express from "express";
 import cors from "cors";
 import { SuiGrpcClient } from "@mysten/sui/grpc";
 import { Ed25519Keypair } from "@mysten/sui/keypairs/ed25519";
-import { Transaction } from "@mysten/sui/transactions";
+import {
+  Transaction,
+  TransactionDataBuilder,
+} from "@mysten/sui/transactions";
 import { decodeSuiPrivateKey } from "@mysten/sui/cryptography";
+import { isValidSuiAddress, normalizeSuiAddress } from "@mysten/sui/utils";
 import { bech32 } from "bech32";
+import { NotMintedError, RequestBatcher } from "./batcher.js";
+import { faucetAbortName } from "./aborts.js";
+import { JobQueue } from "./jobs.js";
+import { MintTemplate } from "./txtemplate.js";
+import { buildRequestTransaction } from "./requesttx.js";
+import { createStubClient } from "./stubclient.js";
+import { CONTENT_TYPE, Registry } from "./metrics.js";
+import {
+  MAX_REQUEST_AMOUNT,
+  MAX_REQUESTS_PER_PERIOD,
+  OnChainLimitMirror,
+  RATE_LIMIT_PERIOD_MS,
+  SlidingWindowLimiter,
+} from "./ratelimit.js";
 
 // Load .env explicitly from backend/.env regardless of cwd
 const __filename = fileURLToPath(import.meta.url);
@@ -15,11 +33,13 @@ const __dirname = path.dirname(__filename);
 dotenvConfig({ path: path.join(__dirname, "..", ".env") });
 
 const app = express();
+// Needed for per-IP limits when running behind a reverse proxy
+if (process.env.TRUST_PROXY) app.set("trust proxy", process.env.TRUST_PROXY);
 app.use(express.json());
 app.use(
   cors({
     origin: ["http://localhost:3000"],
-    methods: ["POST", "OPTIONS"],
+    methods: ["GET", "POST", "OPTIONS"],
   }),
 );
 
@@ -37,6 +57,47 @@ const PRIVATE_KEY_HEX = process.env.SUI_PRIVATE_KEY || "";
 const STABLECOIN_PACKAGE = process.env.STABLECOIN_PACKAGE || "";
 const USDC_PACKAGE = process.env.USDC_PACKAGE || "";
 const TREASURY = process.env.TREASURY || ""; // stablecoin::treasury::Treasury<USDC>
+// Request coalescing: concurrent mints are merged into one PTB
+const BATCH_MAX_SIZE = Number(process.env.BATCH_MAX_SIZE || 32);
+const BATCH_MAX_WAIT_MS = Number(process.env.BATCH_MAX_WAIT_MS || 25);
+const BATCH_MAX_RETRIES = Number(process.env.BATCH_MAX_RETRIES ?? 3);
+// Cached transaction template (TX_TEMPLATE=0 lets the SDK resolve everything)
+const TX_TEMPLATE = process.env.TX_TEMPLATE !== "0";
+const GAS_BUDGET_PER_MINT = process.env.GAS_BUDGET_PER_MINT || "10000000";
+// Off-chain limits. The FAUCET_* values must match faucet.move's constants.
+const FAUCET_MAX_REQUEST_AMOUNT = Number(
+  process.env.FAUCET_MAX_REQUEST_AMOUNT || MAX_REQUEST_AMOUNT,
+);
+const FAUCET_RATE_LIMIT_PERIOD_MS = Number(
+  process.env.FAUCET_RATE_LIMIT_PERIOD_MS || RATE_LIMIT_PERIOD_MS,
+);
+const FAUCET_MAX_REQUESTS_PER_PERIOD = Number(
+  process.env.FAUCET_MAX_REQUESTS_PER_PERIOD || MAX_REQUESTS_PER_PERIOD,
+);
+const IP_RATE_LIMIT_MAX = Number(process.env.IP_RATE_LIMIT_MAX || 10);
+const IP_RATE_LIMIT_WINDOW_MS = Number(
+  process.env.IP_RATE_LIMIT_WINDOW_MS || 3_600_000,
+);
+// Async mode (POST /api/request?async=1): bounded worker queue
+const JOB_WORKERS = Number(process.env.JOB_WORKERS || BATCH_MAX_SIZE * 2);
+const JOB_QUEUE_MAX = Number(process.env.JOB_QUEUE_MAX || 1000);
+const JOB_TTL_MS = Number(process.env.JOB_TTL_MS || 600_000);
+// Fraction of successful mint batches logged (errors are always logged)
+const LOG_SAMPLE_RATE = Number(process.env.LOG_SAMPLE_RATE ?? 0.01);
+// Offline fake fullnode for load tests (never enable against a real network)
+const FULLNODE_STUB = process.env.FULLNODE_STUB === "1";
+
+// The fake only runs when the network is explicitly the load-test one, so a
+// stray FULLNODE_STUB=1 cannot turn a deployed faucet into one that mints nothing
+if (FULLNODE_STUB !== (SUI_NETWORK === "stub")) {
+  // eslint-disable-next-line no-console
+  console.error(
+    FULLNODE_STUB
+      ? `FULLNODE_STUB=1 requires SUI_NETWORK=stub (got ${SUI_NETWORK}); refusing to start`
+      : "SUI_NETWORK=stub requires FULLNODE_STUB=1; refusing to start",
+  );
+  process.exit(1);
+}
 
 // Diagnose missing envs explicitly (without printing secrets)
 const isStablecoinMode = !!(
@@ -71,19 +132,34 @@ switch (SUI_NETWORK) {
   case "testnet":
     grpcUrl = TESTNET_GRPC_URL;
     break;
+  case "stub":
+    break; // offline fake fullnode, no URL
   default:
     grpcUrl = DEVNET_GRPC_URL; // Default to devnet
     console.warn(`Unknown network ${SUI_NETWORK}, defaulting to devnet`);
 }
 
-console.log(`Using gRPC URL for ${SUI_NETWORK}:`, grpcUrl);
+let client;
+if (FULLNODE_STUB) {
+  client = createStubClient({
+    latencyMs: Number(process.env.FULLNODE_STUB_LATENCY_MS ?? 500),
+    jitterMs: Number(process.env.FULLNODE_STUB_JITTER_MS ?? 100),
+    errorRate: Number(process.env.FULLNODE_STUB_ERROR_RATE ?? 0),
+    abortRate: Number(process.env.FULLNODE_STUB_ABORT_RATE ?? 0),
+  });
+  console.warn(
+    "SUI_NETWORK=stub: using the offline fake fullnode, no real mints",
+  );
+} else {
+  console.log(`Using gRPC URL for ${SUI_NETWORK}:`, grpcUrl);
 
-// Configure gRPC client using SuiGrpcTransportOptions
-const client = new SuiGrpcClient({
-  baseUrl: grpcUrl,
-  network: SUI_NETWORK,
-});
-console.log("gRPC client created successfully");
+  // Configure gRPC client using SuiGrpcTransportOptions
+  client = new SuiGrpcClient({
+    baseUrl: grpcUrl,
+    network: SUI_NETWORK,
+  });
+  console.log("gRPC client created successfully");
+}
 
 function hexToBytes(hex) {
   const s = hex.startsWith("0x") ? hex.slice(2) : hex;
@@ -138,7 +214,234 @@ function loadKeypairFromEnv(secret) {
 
 const keypair = PRIVATE_KEY_HEX ? loadKeypairFromEnv(PRIVATE_KEY_HEX) : null;
 
+// Metrics (GET /metrics)
+const metrics = new Registry();
+const requestSeconds = metrics.histogram(
+  "faucet_request_duration_seconds",
+  "End-to-end /api/request latency by mode (async: until the 202 reply)",
+  [0.005, 0.025, 0.1, 0.25, 0.5, 1, 2, 4, 8, 16],
+);
+const phaseSeconds = metrics.histogram(
+  "faucet_phase_duration_seconds",
+  "Time per phase: validation (per request); build, sign, execute (per batch transaction)",
+  [0.0001, 0.001, 0.005, 0.025, 0.1, 0.25, 0.5, 1, 2, 4, 8],
+);
+const requestsTotal = metrics.counter(
+  "faucet_requests_total",
+  "Faucet requests by outcome",
+);
+const abortsTotal = metrics.counter(
+  "faucet_move_aborts_total",
+  "Requests failed by a stablecoin::faucet Move abort, by error constant",
+);
+const gasPerMint = metrics.histogram(
+  "faucet_gas_per_mint_mist",
+  "Net gas (computation + storage - rebate) per request_for, in MIST",
+  [5e5, 1e6, 2e6, 3e6, 4e6, 5e6, 7.5e6, 1e7, 2e7],
+);
+const gasUsedTotal = metrics.counter(
+  "faucet_gas_used_mist_total",
+  "Net gas spent on mint transactions, in MIST",
+);
+const inflight = metrics.gauge(
+  "faucet_requests_in_flight",
+  "/api/request calls currently being handled",
+);
+inflight.set(0);
+metrics.gauge(
+  "faucet_batch_pending",
+  "Mints waiting for the next batch transaction",
+  () => batcher.pending,
+);
+metrics.gauge(
+  "faucet_jobs_queued",
+  "Async jobs waiting for a worker",
+  () => jobs.depth,
+);
+
+function logSampled(event, fields) {
+  if (Math.random() >= LOG_SAMPLE_RATE) return;
+  console.log(JSON.stringify({ ts: new Date().toISOString(), event, ...fields }));
+}
+
+function netGasUsed(effects) {
+  const g = effects?.gasUsed;
+  if (!g) return null;
+  return Number(
+    BigInt(g.computationCost) + BigInt(g.storageCost) - BigInt(g.storageRebate),
+  );
+}
+
+const template =
+  keypair && TX_TEMPLATE
+    ? new MintTemplate({
+        client,
+        sender: keypair.toSuiAddress(),
+        objects: { faucet: FAUCET_ID, treasury: TREASURY, clock: CLOCK },
+        gasBudgetPerMint: GAS_BUDGET_PER_MINT,
+      })
+    : null;
+
+async function executeRequests(entries) {
+  let bytes, signature, result;
+  try {
+    // Build, sign and execute separately so each phase can be timed
+    let done = phaseSeconds.startTimer({ phase: "build" });
+    const tx = await buildRequestTransaction(new Transaction(), entries, {
+      sender: keypair.toSuiAddress(),
+      template,
+      objects: { faucet: FAUCET_ID, treasury: TREASURY, clock: CLOCK },
+      stablecoinPackage: STABLECOIN_PACKAGE,
+      coinType: `${USDC_PACKAGE}::usdc::USDC`,
+    });
+    bytes = await tx.build({ client });
+    done();
+
+    done = phaseSeconds.startTimer({ phase: "sign" });
+    ({ signature } = await keypair.signTransaction(bytes));
+    done();
+  } catch (e) {
+    // Cached versions/gas price may be stale; re-resolve on the next build
+    template?.invalidate();
+    throw new NotMintedError(e);
+  }
+
+  try {
+    const done = phaseSeconds.startTimer({ phase: "execute" });
+    result = await client.core.executeTransaction({
+      transaction: bytes,
+      signatures: [signature],
+      include: { effects: true },
+    });
+    done();
+  } catch (e) {
+    // Submitted but no answer (deadline, UNAVAILABLE, ...): it may still land
+    template?.invalidate();
+    const digest = TransactionDataBuilder.getDigestFromBytes(bytes);
+    throw new Error(
+      `${e?.message || e} (transaction ${digest} may still have executed)`,
+      { cause: e },
+    );
+  }
+  const executed = result.Transaction || result.FailedTransaction;
+  template?.observe(executed);
+
+  const gas = netGasUsed(executed?.effects);
+  if (gas !== null) {
+    gasUsedTotal.inc({}, gas);
+    gasPerMint.observe({}, gas / entries.length);
+  }
+  logSampled("mint_batch", {
+    digest: executed?.digest,
+    mints: entries.length,
+    gas,
+    ok: !result.FailedTransaction,
+  });
+
+  // Execution failures come back as a FailedTransaction rather than a throw
+  const failed = result.FailedTransaction;
+  if (failed) {
+    const reason = failed.status?.error;
+    throw new NotMintedError(
+      new Error(
+        (typeof reason === "string" ? reason : reason?.message) ||
+          `Transaction ${failed.digest} failed`,
+      ),
+      { digest: failed.digest },
+    );
+  }
+
+  // Extract digest from the nested response structure
+  return result.Transaction?.digest || result.digest;
+}
+
+const batcher = new RequestBatcher({
+  maxBatchSize: BATCH_MAX_SIZE,
+  maxWaitMs: BATCH_MAX_WAIT_MS,
+  maxRetries: BATCH_MAX_RETRIES,
+  execute: executeRequests,
+});
+
+const signerLimit = new OnChainLimitMirror({
+  periodMs: FAUCET_RATE_LIMIT_PERIOD_MS,
+  maxPerPeriod: FAUCET_MAX_REQUESTS_PER_PERIOD,
+  maxAmount: FAUCET_MAX_REQUEST_AMOUNT,
+});
+const ipLimit = new SlidingWindowLimiter({
+  windowMs: IP_RATE_LIMIT_WINDOW_MS,
+  max: IP_RATE_LIMIT_MAX,
+});
+
+const jobs = new JobQueue({
+  workers: JOB_WORKERS,
+  maxQueued: JOB_QUEUE_MAX,
+  ttlMs: JOB_TTL_MS,
+});
+
+// Mint through the batcher; give the rate-limit slot back only when the mint
+// certainly did not happen, unless the chain says we're over the limit.
+async function mint(entry) {
+  try {
+    return { digest: await batcher.submit(entry) };
+  } catch (e) {
+    const abort = faucetAbortName(e);
+    if (abort) abortsTotal.inc({ code: abort });
+    if (abort === "ERateLimitExceeded") signerLimit.exhaust();
+    else if (e instanceof NotMintedError) signerLimit.release();
+    throw e;
+  }
+}
+
+// Async jobs have no HTTP response left to carry the outcome: count and log it here
+async function mintJob(entry) {
+  try {
+    const result = await mint(entry);
+    requestsTotal.inc({ outcome: "ok" });
+    return result;
+  } catch (e) {
+    requestsTotal.inc({ outcome: "failed" });
+    // eslint-disable-next-line no-console
+    console.error(e);
+    throw e;
+  }
+}
+
+function jobView(job) {
+  const { id, status, digest, error, createdAt, updatedAt } = job;
+  return { jobId: id, status, digest, error, createdAt, updatedAt };
+}
+
+function rateLimited(res, retryAfterMs, scope) {
+  res.set("Retry-After", String(Math.ceil(retryAfterMs / 1000)));
+  return res.status(429).json({
+    error: `Rate limit exceeded (${scope}). Please wait before trying again.`,
+    retryAfterMs,
+  });
+}
+
+// Tag the response with its outcome for faucet_requests_total
+function fail(res, outcome) {
+  requestsTotal.inc({ outcome });
+  return res;
+}
+
 app.post("/api/request", async (req, res) => {
+  const asyncMode = req.query.async === "1";
+  inflight.inc();
+  const endRequest = requestSeconds.startTimer({
+    mode: asyncMode ? "async" : "sync",
+  });
+  res.on("close", () => {
+    inflight.dec();
+    endRequest();
+  });
+  // Observed once per request, however validation ends (accepted, 400, 429,
+  // 500): the finally below covers every early return and throw
+  let endValidation = phaseSeconds.startTimer({ phase: "validation" });
+  const validated = () => {
+    endValidation?.();
+    endValidation = null;
+  };
   try {
     if (!keypair) throw new Error("Server signer not configured");
     if (!isStablecoinMode) {
@@ -170,52 +473,96 @@ app.post("/api/request", async (req, res) => {
       });
     }
 
+    // Reject anything the transaction builder would choke on before it can
+    // join a batch: one bad entry would otherwise split the whole batch
     const { recipient, amount } = req.body || {};
     if (
       typeof recipient !== "string" ||
       !recipient.startsWith("0x") ||
-      recipient.length < 4
+      !isValidSuiAddress(normalizeSuiAddress(recipient))
     ) {
-      return res.status(400).send("Invalid recipient");
+      return fail(res, "invalid").status(400).send("Invalid recipient");
     }
     const amt = Number(amount);
-    if (!Number.isFinite(amt) || amt <= 0) {
-      return res.status(400).send("Invalid amount");
+    if (!Number.isSafeInteger(amt) || !signerLimit.validAmount(amt)) {
+      return fail(res, "invalid").status(400).send("Invalid amount");
     }
 
-    const tx = new Transaction();
-    // Circle stablecoin faucet path (generic over T=USDC)
-    tx.moveCall({
-      target: `${STABLECOIN_PACKAGE}::faucet::request_for`,
-      typeArguments: [`${USDC_PACKAGE}::usdc::USDC`],
-      arguments: [
-        tx.object(FAUCET_ID),
-        tx.object(TREASURY),
-        tx.pure.address(recipient),
-        tx.pure.u64(amt),
-        tx.object(CLOCK),
-      ],
-    });
-
-    const result = await client.signAndExecuteTransaction({
-      signer: keypair,
-      transaction: tx,
-    });
-
-    console.log("Transaction result:", result);
+    const ipRetryMs = ipLimit.hit(req.ip);
+    if (ipRetryMs) {
+      return rateLimited(fail(res, "rate_limited"), ipRetryMs, "per client");
+    }
+    if (!signerLimit.tryReserve()) {
+      return rateLimited(
+        fail(res, "rate_limited"),
+        signerLimit.retryAfterMs(),
+        "faucet",
+      );
+    }
+    validated();
 
-    // Extract digest from the nested response structure
-    const digest = result.Transaction?.digest || result.digest;
-    console.log("Extracted digest:", digest);
+    const entry = { recipient, amount: amt };
+    if (asyncMode) {
+      const job = jobs.enqueue(() => mintJob(entry));
+      if (!job) {
+        signerLimit.release();
+        res.set("Retry-After", "5");
+        return fail(res, "queue_full")
+          .status(503)
+          .json({ error: "Faucet queue is full" });
+      }
+      requestsTotal.inc({ outcome: "queued" });
+      return res.status(202).json(jobView(job));
+    }
 
+    const { digest } = await mint(entry);
+    requestsTotal.inc({ outcome: "ok" });
     return res.json({ digest });
   } catch (e) {
     // eslint-disable-next-line no-console
     console.error(e);
-    return res.status(500).send(e?.message || "Server error");
+    return fail(res, "failed")
+      .status(500)
+      .send(e?.message || "Server error");
+  } finally {
+    validated();
   }
 });
 
+app.get("/metrics", (req, res) => {
+  res.set("Content-Type", CONTENT_TYPE);
+  res.send(metrics.render());
+});
+
+app.get("/api/jobs/:id", (req, res) => {
+  const job = jobs.get(req.params.id);
+  if (!job) return res.status(404).json({ error: "Unknown job" });
+  return res.json(jobView(job));
+});
+
+// Server-Sent Events: one `status` event per state change, closed when done
+app.get("/api/jobs/:id/events", (req, res) => {
+  const job = jobs.get(req.params.id);
+  if (!job) return res.status(404).json({ error: "Unknown job" });
+
+  res.set({
+    "Content-Type": "text/event-stream",
+    "Cache-Control": "no-cache",
+    Connection: "keep-alive",
+  });
+  res.flushHeaders();
+
+  const send = (j) => {
+    res.write(`event: status\ndata: ${JSON.stringify(jobView(j))}\n\n`);
+    if (JobQueue.isTerminal(j)) res.end();
+  };
+  send(job);
+  if (JobQueue.isTerminal(job)) return;
+
+  jobs.on(job.id, send);
+  res.on("close", () => jobs.off(job.id, send));
+});
+
 app.listen(PORT, () => {
   // eslint-disable-next-line no-console
   console.log(`Backend listening on http://localhost:${PORT}`);
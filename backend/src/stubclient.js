@@ -0,0 +1,134 @@
+// Offline stand-in for the fullnode client, for load tests (FULLNODE_STUB=1
+// with SUI_NETWORK=stub; server.js refuses to start with only one of them).
+//
+// Implements only the `client.core` calls that server.js and MintTemplate
+// make when the transaction template is enabled. Executions resolve after a
+// tunable latency with synthetic effects, so batching, rate limiting, the job
+// queue and the template run exactly as they would against a real fullnode.
+// Any other `core` method throws, naming the method.
+import { Transaction, TransactionDataBuilder } from "@mysten/sui/transactions";
+
+const GAS_COIN_ID = `0x${"5".repeat(64)}`;
+const EPOCH_DURATION_MS = 86_400_000;
+
+function gaussianMs(mean, stddev) {
+  const u = 1 - Math.random();
+  const v = Math.random();
+  const z = Math.sqrt(-2 * Math.log(u)) * Math.cos(2 * Math.PI * v);
+  return Math.max(0, mean + stddev * z);
+}
+
+/**
+ * @param {object} opts
+ * @param {number} opts.latencyMs   mean executeTransaction latency
+ * @param {number} opts.jitterMs    standard deviation of that latency
+ * @param {number} opts.errorRate   fraction of executions that throw UNAVAILABLE
+ *                                  (outcome unknown to the caller; not applied)
+ * @param {number} opts.abortRate   fraction of executions that fail on chain
+ *                                  with a faucet EInvalidAmount abort
+ * @param {number} opts.gasPerMint  computation cost charged per command, in MIST
+ */
+export function createStubClient({
+  latencyMs = 500,
+  jitterMs = 100,
+  errorRate = 0,
+  abortRate = 0,
+  gasPerMint = 2_000_000,
+} = {}) {
+  const epochStart = Date.now();
+  const gasCoin = {
+    version: 1,
+    digest: TransactionDataBuilder.getDigestFromBytes(new Uint8Array([0])),
+  };
+
+  const core = {
+    resolveTransactionPlugin() {
+      // Every input is pre-resolved by MintTemplate; nothing to look up
+      return async (_transactionData, _options, next) => next();
+    },
+
+    async getObjects({ objectIds }) {
+      return {
+        objects: objectIds.map((objectId) => ({
+          objectId,
+          version: "1",
+          owner: { Shared: { initialSharedVersion: "1" } },
+        })),
+      };
+    },
+
+    async getCurrentSystemState() {
+      return {
+        systemState: {
+          epoch: "1",
+          epochStartTimestampMs: String(epochStart),
+          epochDurationMs: String(EPOCH_DURATION_MS),
+          referenceGasPrice: "1000",
+        },
+      };
+    },
+
+    async listCoins() {
+      return {
+        objects: [
+          {
+            objectId: GAS_COIN_ID,
+            version: String(gasCoin.version),
+            digest: gasCoin.digest,
+            balance: "1000000000000000",
+          },
+        ],
+      };
+    },
+
+    async executeTransaction({ transaction }) {
+      await new Promise((r) => setTimeout(r, gaussianMs(latencyMs, jitterMs)));
+      if (Math.random() < errorRate) {
+        throw new Error("14 UNAVAILABLE: stub fullnode unavailable");
+      }
+
+      const digest = TransactionDataBuilder.getDigestFromBytes(transaction);
+      const commands = Transaction.from(transaction).getData().commands.length;
+      gasCoin.version += 1;
+      gasCoin.digest = digest;
+      const effects = {
+        gasUsed: {
+          computationCost: String(gasPerMint * commands),
+          storageCost: "0",
+          storageRebate: "0",
+        },
+        gasObject: {
+          objectId: GAS_COIN_ID,
+          outputVersion: String(gasCoin.version),
+          outputDigest: gasCoin.digest,
+        },
+      };
+
+      if (Math.random() < abortRate) {
+        const command = Math.floor(Math.random() * commands);
+        const error =
+          'MoveAbort(MoveLocation { module: ModuleId { address: 0x0, name: Identifier("faucet") }, ' +
+          `function: 0, instruction: 0, function_name: Some("request_for") }, 5) in command ${command}`;
+        return {
+          FailedTransaction: { digest, status: { success: false, error }, effects },
+        };
+      }
+      return { Transaction: { digest, effects } };
+    },
+  };
+
+  return {
+    core: new Proxy(core, {
+      get(target, name) {
+        if (name in target || typeof name === "symbol" || name === "then") {
+          return target[name];
+        }
+        return () => {
+          throw new Error(
+            `Stub fullnode does not implement core.${name} (requires TX_TEMPLATE=1)`,
+          );
+        };
+      },
+    }),
+  };
+}
@@ -0,0 +1,141 @@
+// Pre-resolved inputs for faucet mint transactions.
+//
+// Left to itself the SDK resolves every `tx.object(id)`, the reference gas
+// price, the gas coins and a dry-run gas budget each time a transaction is
+// built. The template resolves the shared objects' initial versions, the
+// epoch's reference gas price and a gas coin once, then lets every mint be
+// built offline. The `request_for` arguments are already typed
+// (`tx.pure.address` / `tx.pure.u64`), so no Move signature lookup is needed.
+//
+// The cache expires at the end of the epoch it was read in (gas price can
+// change), follows the gas coin's new version from each execution's effects,
+// and is dropped by `invalidate()` whenever execution fails for a reason other
+// than a Move abort (stale version, gas, config change, ...).
+
+const SUI_COIN_TYPE = "0x2::sui::SUI";
+// Used when the system state doesn't tell us when the epoch ends
+const FALLBACK_TTL_MS = 60_000;
+
+function sharedVersion(obj, id) {
+  if (!obj || obj instanceof Error) {
+    throw new Error(`Could not load object ${id}: ${obj?.message || "missing"}`);
+  }
+  const version = obj.owner?.Shared?.initialSharedVersion;
+  if (version === undefined) throw new Error(`Object ${id} is not shared`);
+  return version;
+}
+
+export class MintTemplate {
+  #state = null;
+  #loading = null;
+
+  /**
+   * @param {object} opts
+   * @param {import("@mysten/sui/grpc").SuiGrpcClient} opts.client
+   * @param {string} opts.sender            server signer address (pays gas)
+   * @param {{ faucet: string, treasury: string, clock: string }} opts.objects
+   * @param {bigint} opts.gasBudgetPerMint  budget for one `request_for` command
+   */
+  constructor({ client, sender, objects, gasBudgetPerMint }) {
+    this.client = client;
+    this.sender = sender;
+    this.objects = objects;
+    this.gasBudgetPerMint = BigInt(gasBudgetPerMint);
+  }
+
+  async #load() {
+    const { faucet, treasury, clock } = this.objects;
+    const [{ objects }, { systemState }, { objects: coins }] =
+      await Promise.all([
+        this.client.core.getObjects({ objectIds: [faucet, treasury, clock] }),
+        this.client.core.getCurrentSystemState(),
+        this.client.core.listCoins({
+          owner: this.sender,
+          coinType: SUI_COIN_TYPE,
+        }),
+      ]);
+
+    const gasCoin = coins.reduce(
+      (best, c) => (!best || BigInt(c.balance) > BigInt(best.balance) ? c : best),
+      null,
+    );
+    if (!gasCoin) throw new Error(`No SUI gas coins owned by ${this.sender}`);
+
+    const epochEnd =
+      Number(systemState.epochStartTimestampMs) +
+      Number(
+        systemState.epochDurationMs ?? systemState.parameters?.epochDurationMs,
+      );
+
+    return {
+      epoch: systemState.epoch,
+      expiresAt: Number.isFinite(epochEnd)
+        ? epochEnd
+        : Date.now() + FALLBACK_TTL_MS,
+      gasPrice: BigInt(systemState.referenceGasPrice),
+      gasCoin: {
+        objectId: gasCoin.objectId,
+        version: gasCoin.version,
+        digest: gasCoin.digest,
+      },
+      versions: {
+        faucet: sharedVersion(objects[0], faucet),
+        treasury: sharedVersion(objects[1], treasury),
+        clock: sharedVersion(objects[2], clock),
+      },
+    };
+  }
+
+  async #current() {
+    if (this.#state && Date.now() < this.#state.expiresAt) return this.#state;
+    // Single-flight: concurrent builds share one resolution round
+    this.#loading ??= this.#load().finally(() => {
+      this.#loading = null;
+    });
+    this.#state = await this.#loading;
+    return this.#state;
+  }
+
+  /**
+   * Fill in sender, gas price, budget and payment for a transaction with
+   * `mints` request_for commands, and return the shared object inputs to use.
+   */
+  async prepare(tx, mints) {
+    const { versions, gasPrice, gasCoin } = await this.#current();
+    tx.setSender(this.sender);
+    tx.setGasPrice(gasPrice);
+    tx.setGasBudget(this.gasBudgetPerMint * BigInt(mints));
+    tx.setGasPayment([gasCoin]);
+
+    const shared = (objectId, initialSharedVersion, mutable) =>
+      tx.sharedObjectRef({ objectId, initialSharedVersion, mutable });
+    return {
+      faucet: shared(this.objects.faucet, versions.faucet, true),
+      treasury: shared(this.objects.treasury, versions.treasury, true),
+      clock: shared(this.objects.clock, versions.clock, false),
+    };
+  }
+
+  /** Track the gas coin's new version from an executed (or failed) transaction. */
+  observe(transaction) {
+    const gas = transaction?.effects?.gasObject;
+    if (
+      !this.#state ||
+      !gas?.outputVersion ||
+      !gas?.outputDigest ||
+      gas.objectId !== this.#state.gasCoin.objectId
+    ) {
+      this.invalidate();
+      return;
+    }
+    this.#state.gasCoin = {
+      objectId: gas.objectId,
+      version: gas.outputVersion,
+      digest: gas.outputDigest,
+    };
+  }
+
+  invalidate() {
+    this.#state = null;
+  }
+}
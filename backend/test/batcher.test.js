@@ -0,0 +1,75 @@
+import assert from "node:assert/strict";
+import { test } from "node:test";
+import { NotMintedError, RequestBatcher } from "../src/batcher.js";
+
+const abort = (code, command) =>
+  'MoveAbort(MoveLocation { module: ModuleId { address: 0x5, name: Identifier("faucet") }, ' +
+  `function: 2, instruction: 9, function_name: Some("request_for") }, ${code}) in command ${command}`;
+const failed = (message) => new NotMintedError(new Error(message), { digest: "D" });
+
+// Submit `size` entries at once; `fail(entries, call)` returns an error to
+// throw, or nothing to succeed. Returns the execution count and each outcome.
+async function runBatch(size, fail, opts = {}) {
+  let calls = 0;
+  const batcher = new RequestBatcher({
+    maxBatchSize: size,
+    maxWaitMs: 0,
+    ...opts,
+    execute: async (entries) => {
+      calls += 1;
+      const error = fail(entries, calls);
+      if (error) throw error;
+      return `digest${calls}`;
+    },
+  });
+  const results = await Promise.allSettled(
+    Array.from({ length: size }, (_, i) => batcher.submit(i)),
+  );
+  return {
+    calls,
+    ok: results.filter((r) => r.status === "fulfilled").length,
+  };
+}
+
+test("errors before submission reject the whole batch once", async () => {
+  const { calls, ok } = await runBatch(32, () =>
+    new NotMintedError(new Error("14 UNAVAILABLE: fullnode unreachable")),
+  );
+  assert.deepEqual({ calls, ok }, { calls: 1, ok: 0 });
+});
+
+test("batch-wide on-chain failures are not retried", async () => {
+  for (const message of [abort(6, 0), abort(4, 3), "InsufficientGas"]) {
+    const { calls, ok } = await runBatch(32, () => failed(message));
+    assert.deepEqual({ calls, ok }, { calls: 1, ok: 0 }, message);
+  }
+});
+
+test("an unknown outcome after submission rejects the whole batch", async () => {
+  const { calls, ok } = await runBatch(8, () => new Error("DEADLINE_EXCEEDED"));
+  assert.deepEqual({ calls, ok }, { calls: 1, ok: 0 });
+});
+
+test("an entry blamed by EInvalidAmount is dropped and the rest retried", async () => {
+  const { calls, ok } = await runBatch(32, (entries) => {
+    const bad = entries.indexOf(7);
+    return bad >= 0 ? failed(abort(5, bad)) : null;
+  });
+  assert.deepEqual({ calls, ok }, { calls: 2, ok: 31 });
+});
+
+test("ERateLimitExceeded rejects the named entry and every later one", async () => {
+  const { calls, ok } = await runBatch(10, (entries) =>
+    entries.length > 3 ? failed(abort(1, 3)) : null,
+  );
+  assert.deepEqual({ calls, ok }, { calls: 2, ok: 3 });
+});
+
+test("retries per batch are capped", async () => {
+  const { calls, ok } = await runBatch(
+    32,
+    () => failed(abort(5, 0)),
+    { maxRetries: 3 },
+  );
+  assert.deepEqual({ calls, ok }, { calls: 4, ok: 0 });
+});
@@ -0,0 +1,85 @@
+import assert from "node:assert/strict";
+import { test } from "node:test";
+import { buildRequestTransaction } from "../src/requesttx.js";
+
+const SENDER = `0x${"a".repeat(64)}`;
+const OPTS = {
+  sender: SENDER,
+  objects: { faucet: "0x1", treasury: "0x2", clock: "0x6" },
+  stablecoinPackage: "0x5",
+  coinType: "0x7::usdc::USDC",
+};
+const ENTRIES = [
+  { recipient: "0x10", amount: 1 },
+  { recipient: "0x11", amount: 2 },
+];
+
+// Records what the builder asks of a `Transaction` and, like `tx.build()`,
+// refuses to serialize one without a sender.
+class FakeTransaction {
+  sender = null;
+  calls = [];
+  pure = {
+    address: (a) => ({ pure: "address", value: a }),
+    u64: (v) => ({ pure: "u64", value: v }),
+  };
+
+  setSender(sender) {
+    this.sender = sender;
+  }
+  setSenderIfNotSet(sender) {
+    this.sender ??= sender;
+  }
+  object(id) {
+    return { object: id };
+  }
+  moveCall(call) {
+    this.calls.push(call);
+  }
+  build() {
+    if (!this.sender) throw new Error("Missing transaction sender");
+    return this.calls.length;
+  }
+}
+
+test("TX_TEMPLATE=0: the SDK-resolved path sets the signer as sender", async () => {
+  const tx = await buildRequestTransaction(new FakeTransaction(), ENTRIES, {
+    ...OPTS,
+    template: null,
+  });
+  assert.equal(tx.sender, SENDER);
+  assert.equal(tx.build(), 2);
+  assert.deepEqual(tx.calls[1], {
+    target: "0x5::faucet::request_for",
+    typeArguments: ["0x7::usdc::USDC"],
+    arguments: [
+      { object: "0x1" },
+      { object: "0x2" },
+      { pure: "address", value: "0x11" },
+      { pure: "u64", value: 2 },
+      { object: "0x6" },
+    ],
+  });
+});
+
+test("template path uses the template's inputs", async () => {
+  const template = {
+    async prepare(tx, mints) {
+      assert.equal(mints, ENTRIES.length);
+      tx.setSender(SENDER);
+      return { faucet: "F", treasury: "T", clock: "C" };
+    },
+  };
+  const tx = await buildRequestTransaction(new FakeTransaction(), ENTRIES, {
+    ...OPTS,
+    template,
+  });
+  assert.equal(tx.sender, SENDER);
+  assert.deepEqual(
+    tx.calls.map((c) => [c.arguments[0], c.arguments[1], c.arguments[4]]),
+    [
+      ["F", "T", "C"],
+      ["F", "T", "C"],
+    ],
+  );
+});
@@ -14,6 +14,47 @@ function parseErrorMessage(error: string): string {
   return error;
 }
 
+type JobStatus = {
+  jobId: string;
+  status: 'queued' | 'running' | 'succeeded' | 'failed';
+  digest?: string;
+  error?: string;
+};
+
+// Follow an async faucet job until it finishes. Uses the backend's SSE stream
+// and falls back to polling if the stream can't be opened or drops.
+function waitForJob(jobId: string): Promise<JobStatus> {
+  const url = `${API_BASE}/api/jobs/${jobId}`;
+  const done = (j: JobStatus) =>
+    j.status === 'succeeded' || j.status === 'failed';
+
+  const poll = async (): Promise<JobStatus> => {
+    for (;;) {
+      const res = await fetch(url);
+      if (!res.ok) throw new Error(`Job lookup failed with ${res.status}`);
+      const job: JobStatus = await res.json();
+      if (done(job)) return job;
+      await new Promise((r) => setTimeout(r, 1000));
+    }
+  };
+
+  if (typeof EventSource === 'undefined') return poll();
+  return new Promise((resolve, reject) => {
+    const es = new EventSource(`${url}/events`);
+    es.addEventListener('status', (ev) => {
+      const job: JobStatus = JSON.parse((ev as MessageEvent).data);
+      if (done(job)) {
+        es.close();
+        resolve(job);
+      }
+    });
+    es.onerror = () => {
+      es.close();
+      poll().then(resolve, reject);
+    };
+  });
+}
+
 type AppState = {
   amount: string;
   recipient: string;
@@ -51,7 +92,7 @@ export const useAppStore = create<AppState>((set, get) => ({
     setError(null);
     try {
       const amt = Math.floor(Number(amount) * 1_000_000);
-      const res = await fetch(`${API_BASE}/api/request`, {
+      const res = await fetch(`${API_BASE}/api/request?async=1`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ recipient, amount: amt })
@@ -67,7 +108,13 @@ export const useAppStore = create<AppState>((set, get) => ({
         const msg = await res.text();
         throw new Error(msg || `Request failed with ${res.status}`);
       }
-      const data = await res.json();
+      let data = await res.json();
+      if (data.jobId && !data.digest) {
+        data = await waitForJob(data.jobId);
+        if (data.status === 'failed') {
+          throw new Error(data.error || 'Request failed');
+        }
+      }
       const digest = data.digest || data.txDigest || null;
       setTxDigest(digest);
       setLastSent({ recipient, amount: Number(amount) });
@@ -4,17 +4,32 @@ Comprehensive build script for SUI stablecoin faucet deployment.
 Follows the README.md workflow to build and publish all packages:
 1. sui_extensions
 2. stablecoin
-3. usdc
-4. Create Treasury
-5. Create faucet
+3. every coin package in COINS (usdc by default), each published once
+4. Create faucet (per coin, on the Treasury its init shared; coins are
+   processed concurrently)
 
 Extracts and saves all contract IDs to JSON files and contract_ids.env.
+
+Runs hold an advisory lock on json/.build_all.lock. With --run-id, a run
+builds and publishes from its own copy of packages/ under runs/<id>/ and only
+promotes the final contract_ids.env into json/ (atomically, under the lock).
 """
 
+import argparse
+import contextlib
+import fcntl
 import json
+import os
+import shutil
 import sys
 import re
+import queue
+import random
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+import urllib.error
+import urllib.request
 from pathlib import Path
 
 GAS_BUDGET = '300000000'
@@ -30,6 +45,59 @@ TARGET_NETWORK = 'devnet'
 # does NOT change the publish target (that's the active `sui client` env).
 BUILD_ENV = 'testnet'
 
+# Retry policy per step type. Only failures that look transient (network,
+# fullnode overload, timeouts) are retried; delays back off exponentially from
+# `base_delay` up to `max_delay` seconds, with jitter. Publish/call retries are
+# preceded by a check that the failed attempt did not execute anyway.
+RETRY_POLICIES = {
+    'build': {'attempts': 3, 'base_delay': 2.0, 'max_delay': 20.0},
+    'query': {'attempts': 5, 'base_delay': 1.0, 'max_delay': 15.0},
+    'publish': {'attempts': 4, 'base_delay': 3.0, 'max_delay': 45.0},
+    'call': {'attempts': 4, 'base_delay': 2.0, 'max_delay': 30.0},
+}
+
+TRANSIENT_ERROR_PATTERN = re.compile(
+    r'timed? ?out|timeout|deadline|connection (?:refused|reset|closed|error)|'
+    r'failed to connect|error sending request|error trying to connect|'
+    r'unavailable|too many requests|rate.?limit|\b(?:429|502|503|504)\b|'
+    r'broken pipe|dns error|network',
+    re.IGNORECASE,
+)
+# Base58 transaction digest printed next to the word "digest"
+DIGEST_PATTERN = re.compile(r'[Dd]igest\W{1,4}([1-9A-HJ-NP-Za-km-z]{43,44})')
+SUI_COIN_TYPE = '0x2::coin::Coin<0x2::sui::SUI>'
+
+# Coins to deploy faucets for. `package` is the directory under packages/ (a
+# package is published once even if it defines several coins); `module` and
+# `type_name` form the coin type `<package id>::<module>::<type_name>`. The
+# package's `init` is expected to share a `stablecoin::treasury::Treasury` for
+# the coin, like packages/usdc does. To add a test coin, copy packages/usdc,
+# rename the module and one-time witness, and add an entry here.
+COINS = [
+    {
+        'name': 'usdc',
+        'display_name': 'USDC',
+        'package': 'usdc',
+        'module': 'usdc',
+        'type_name': 'USDC',
+        'decimals': 6,
+        'icon': '💰',
+    },
+]
+# Advisory lock serializing access to the shared json/ outputs, pubfile and
+# in-place package build/ directories. Isolated (--run-id) runs only take it
+# to copy packages/ and to promote the final manifest.
+LOCK_FILE_NAME = '.build_all.lock'
+DEFAULT_LOCK_TIMEOUT = 900
+RUNS_DIR_NAME = 'runs'
+# Gas coins each live run has reserved (one flock'ed file per run), so that
+# concurrent runs sharing the active address never pay from the same coin.
+GAS_CLAIMS_DIR_NAME = '.gas_claims'
+
+# Each concurrent per-coin worker pays gas from its own SUI coin; when the
+# active address has too few, one is split into coins of this many MIST.
+GAS_COIN_SPLIT_AMOUNT = 2 * int(GAS_BUDGET)
+
 # ANSI Color Codes
 class Colors:
     """ANSI color codes for professional terminal output."""
@@ -89,27 +157,49 @@ class PackageConfig:
             'extract_treasury': False,
             'step_number': 2,
             'step_name': 'Building and Publishing Stablecoin'
-        },
-        'usdc': {
-            'name': 'usdc',
-            'display_name': 'USDC',
-            'icon': '💰',
-            'needs_unpublished_deps': True,
-            'extract_treasury': True,
-            'step_number': 3,
-            'step_name': 'Building and Publishing USDC'
         }
     }
     
+    @classmethod
+    def get_coin_package_configs(cls):
+        """Get one configuration per coin package in COINS, in first-seen order."""
+        configs = {}
+        for coin in COINS:
+            config = configs.setdefault(coin['package'], {
+                'name': coin['package'],
+                'icon': coin.get('icon', '💰'),
+                'needs_unpublished_deps': True,
+                'extract_treasury': True,
+                'coins': [],
+            })
+            config['coins'].append(coin)
+        for config in configs.values():
+            config['display_name'] = ', '.join(coin['display_name'] for coin in config['coins'])
+            config['step_number'] = 3
+            config['step_name'] = f"Building and Publishing {config['display_name']}"
+        return list(configs.values())
+    
     @classmethod
     def get_config(cls, package_name):
         """Get configuration for a specific package."""
-        return cls.PACKAGES.get(package_name)
+        if package_name in cls.PACKAGES:
+            return cls.PACKAGES[package_name]
+        return next((c for c in cls.get_coin_package_configs() if c['name'] == package_name), None)
     
     @classmethod
     def get_all_configs(cls):
         """Get all package configurations in order."""
-        return [cls.PACKAGES['sui_extensions'], cls.PACKAGES['stablecoin'], cls.PACKAGES['usdc']]
+        return [cls.PACKAGES['sui_extensions'], cls.PACKAGES['stablecoin'], *cls.get_coin_package_configs()]
+
+
+def coin_type(coin, package_id):
+    """Full Move type of a COINS entry published at package_id."""
+    return f"{package_id}::{coin['module']}::{coin['type_name']}"
+
+
+def env_prefix(coin):
+    """Prefix of a coin's keys in contract_ids.env (e.g. USDC)."""
+    return re.sub(r'\W', '_', coin['name']).upper()
 
 
 def print_header(title, color=Colors.BRIGHT_CYAN):
@@ -177,19 +267,22 @@ def print_final_results(results):
     print_section("Contract IDs")
     print_contract_id("SUI_EXTENSIONS_PACKAGE", results.get('sui_extensions_package'), "📦")
     print_contract_id("STABLECOIN_PACKAGE", results.get('stablecoin_package'), "📦")
-    print_contract_id("USDC_PACKAGE", results.get('usdc_package'), "💰")
-    print_contract_id("TREASURY", results.get('treasury_id'), "🏛️ ")
-    print_contract_id("FAUCET_ID", results.get('faucet_id'), "🚰")
+    values = [results.get('sui_extensions_package'), results.get('stablecoin_package')]
     
-    # Print USDC contract address if available
-    if results.get('usdc_package'):
-        print_section("USDC Contract Address")
-        usdc_address = f"{results['usdc_package']}::usdc::USDC"
-        print(f"{Colors.BRIGHT_GREEN}💵 {Colors.BOLD}Address:{Colors.RESET} {Colors.BRIGHT_WHITE}{usdc_address}{Colors.RESET}")
+    for coin in COINS:
+        ids = results['coins'][coin['name']]
+        prefix = env_prefix(coin)
+        print_section(f"{coin['display_name']} ({coin['decimals']} decimals)")
+        print_contract_id(f"{prefix}_PACKAGE", ids['package'], coin.get('icon', '💰'))
+        print_contract_id(f"{prefix}_TREASURY", ids['treasury_id'], "🏛️ ")
+        print_contract_id(f"{prefix}_FAUCET_ID", ids['faucet_id'], "🚰")
+        if ids['package']:
+            print(f"{Colors.BRIGHT_GREEN}💵 {Colors.BOLD}Address:{Colors.RESET} {Colors.BRIGHT_WHITE}{coin_type(coin, ids['package'])}{Colors.RESET}")
+        values += [ids['package'], ids['treasury_id'], ids['faucet_id']]
     
     print_section("Status")
-    success_count = sum(1 for v in results.values() if v)
-    total_count = len(results)
+    success_count = sum(1 for v in values if v)
+    total_count = len(values)
     if success_count == total_count:
         print_success(f"All {total_count} components deployed successfully!")
     else:
@@ -212,13 +305,14 @@ def load_json_file(file_path):
         return None
 
 
-def run_command(cmd, cwd=None, capture_output=True):
-    """Run a command and return the result."""
+def run_command_once(cmd, cwd=None, capture_output=True, quiet=False):
+    """Run a command once. Returns (output, error_text); output is None on failure."""
     try:
-        print_command(cmd)
-        if cwd:
-            print_info(f"Working directory: {cwd}")
-        
+        if not quiet:
+            print_command(cmd)
+            if cwd:
+                print_info(f"Working directory: {cwd}")
+
         result = subprocess.run(
             cmd, 
             cwd=cwd, 
@@ -226,23 +320,229 @@ def run_command(cmd, cwd=None, capture_output=True):
             text=True, 
             check=True
         )
-        
+
         if capture_output:
             # Print stdout for debugging
-            if result.stdout:
+            if result.stdout and not quiet:
                 print_info(f"Command output: {result.stdout[:200]}{'...' if len(result.stdout) > 200 else ''}")
-            return result.stdout
-        return True
-        
+            return result.stdout, ''
+        return True, ''
+
     except subprocess.CalledProcessError as e:
-        print_error(f"Command failed with exit code {e.returncode}: {e}")
-        if e.stdout:
-            print_error(f"Stdout: {e.stdout}")
-        if e.stderr:
-            print_error(f"Stderr: {e.stderr}")
-        return None
+        if not quiet:
+            print_error(f"Command failed with exit code {e.returncode}: {e}")
+            if e.stdout:
+                print_error(f"Stdout: {e.stdout}")
+            if e.stderr:
+                print_error(f"Stderr: {e.stderr}")
+        return None, f"{e.stdout or ''}\n{e.stderr or ''}"
     except Exception as e:
-        print_error(f"Unexpected error: {e}")
+        if not quiet:
+            print_error(f"Unexpected error: {e}")
+        return None, str(e)
+
+
+def is_transient_error(error_text):
+    """Whether a failed command's output looks like a transient network/fullnode error."""
+    return bool(error_text and TRANSIENT_ERROR_PATTERN.search(error_text))
+
+
+def backoff_delay(policy, attempt):
+    """Exponential backoff with equal jitter for the given (1-based) attempt."""
+    delay = min(policy['max_delay'], policy['base_delay'] * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def run_command(cmd, cwd=None, capture_output=True, step='query', guard=None):
+    """Run a command, retrying transient failures per RETRY_POLICIES[step].
+
+    For publish/call steps pass an ExecutionGuard. After a failure it checks
+    whether any earlier attempt was executed on chain after all, and if so that
+    transaction's JSON is returned instead of submitting it again. The check
+    runs after the backoff delay, right before each resubmission, because a
+    transaction still finalizing when the CLI timed out is not visible yet.
+    """
+    policy = RETRY_POLICIES[step]
+    if guard:
+        guard.snapshot()
+    for attempt in range(1, policy['attempts'] + 1):
+        output, error_text = run_command_once(cmd, cwd, capture_output)
+        if output is not None:
+            return output
+
+        last = attempt == policy['attempts'] or not is_transient_error(error_text)
+        if last and not guard:
+            return None
+        if is_transient_error(error_text):
+            delay = backoff_delay(policy, attempt)
+            if last:
+                print_info(f"Waiting {delay:.1f}s to check whether the last attempt executed...")
+            else:
+                print_warning(f"Transient failure; retrying in {delay:.1f}s (attempt {attempt + 1}/{policy['attempts']})...")
+            time.sleep(delay)
+
+        if guard:
+            recovered = guard.recover(error_text)
+            if recovered:
+                print_warning("Previous attempt was executed on chain; using its result instead of retrying.")
+                return recovered
+        if last:
+            return None
+    return None
+
+
+def query_json(cmd):
+    """Run a read-only `sui client ... --json` query quietly; returns parsed JSON or None."""
+    for attempt in range(1, RETRY_POLICIES['query']['attempts'] + 1):
+        output, error_text = run_command_once(cmd, quiet=True)
+        if output is not None:
+            try:
+                return json.loads(output)
+            except json.JSONDecodeError:
+                return None
+        if not is_transient_error(error_text):
+            return None
+        time.sleep(backoff_delay(RETRY_POLICIES['query'], attempt))
+    return None
+
+
+def gas_coin_versions():
+    """Map of the active address's SUI coin IDs to their versions."""
+    objects = query_json(['sui', 'client', 'objects', '--json'])
+    if not isinstance(objects, list):
+        return None
+    versions = {}
+    for entry in objects:
+        data = entry.get('data', entry) if isinstance(entry, dict) else {}
+        if data.get('type') == SUI_COIN_TYPE:
+            versions[data.get('objectId')] = str(data.get('version'))
+    return versions
+
+
+def gas_coin_balances():
+    """Map of the active address's SUI coin IDs to their balances in MIST."""
+    coins = query_json(['sui', 'client', 'gas', '--json'])
+    if not isinstance(coins, list):
+        return None
+    return {c['gasCoinId']: int(c.get('mistBalance', 0)) for c in coins if c.get('gasCoinId')}
+
+
+def reserve_gas_coins(count, exclude=()):
+    """Return up to `count` distinct gas coin IDs that can each pay GAS_BUDGET.
+
+    Concurrent `sui client call`s that pick the same gas coin conflict on its
+    version, so every worker gets its own coin. Coins in `exclude` (claimed
+    by other runs) are never returned or split. If there are too few, the
+    largest coin is split with `pay-sui`. Returns an empty list if the coins
+    could not be listed.
+    """
+    def usable():
+        balances = gas_coin_balances() or {}
+        ranked = sorted(balances.items(), key=lambda item: item[1], reverse=True)
+        return [(coin_id, balance) for coin_id, balance in ranked
+                if balance >= int(GAS_BUDGET) and coin_id not in exclude]
+
+    coins = usable()
+    missing = count - len(coins)
+    if missing > 0 and coins:
+        source, balance = coins[0]
+        missing = min(missing, (balance - int(GAS_BUDGET)) // GAS_COIN_SPLIT_AMOUNT)
+    if missing > 0 and coins:
+        print_progress(f"Splitting {missing} gas coin(s) off {source} for concurrent calls...")
+        address = run_command(['sui', 'client', 'active-address'])
+        output = None
+        if address:
+            # No ExecutionGuard: if a retried split lands twice we only get extra coins.
+            output = run_command([
+                'sui', 'client', 'pay-sui',
+                '--input-coins', source,
+                '--recipients', *[address.strip()] * missing,
+                '--amounts', *[str(GAS_COIN_SPLIT_AMOUNT)] * missing,
+                '--gas-budget', GAS_BUDGET,
+                '--json',
+            ], step='call')
+        if output:
+            coins = usable()
+        else:
+            print_warning("Could not split gas coins; continuing with fewer concurrent calls.")
+    return [coin_id for coin_id, _ in coins[:count]]
+
+
+def package_modules(package_dir):
+    """Names of the modules declared in a package's sources/."""
+    modules = set()
+    for path in (package_dir / 'sources').glob('**/*.move'):
+        modules.update(re.findall(r'^\s*module\s+\w+::(\w+)', path.read_text(), re.MULTILINE))
+    return modules
+
+
+def published_modules(data):
+    """Module names of the package published by a transaction, or an empty set."""
+    for change in (data or {}).get('objectChanges', []):
+        if change.get('type') == 'published':
+            return set(change.get('modules', []))
+    return set()
+
+
+def has_created_object(data, type_pattern):
+    """Whether a transaction's objectChanges created an object matching type_pattern."""
+    return any(
+        change.get('type') == 'created' and re.search(type_pattern, change.get('objectType', ''))
+        for change in (data or {}).get('objectChanges', [])
+    )
+
+
+class ExecutionGuard:
+    """Detects whether a failed publish/call actually executed on chain.
+
+    Every transaction from the active address mutates one of its SUI gas coins.
+    A snapshot of coin versions is taken before the first attempt. After each
+    failure, the candidates are the digests printed by the CLI for any attempt
+    so far, plus the `previousTransaction` of every coin whose version moved.
+    A transaction is accepted only if it succeeded and `expect(tx_json)`
+    recognises it as ours. Pass `gas_coin` when the command pins one with
+    `--gas`, so that concurrent transactions on other coins are not considered.
+    """
+
+    def __init__(self, expect, gas_coin=None):
+        self.expect = expect
+        self.gas_coin = gas_coin
+        self.before = None
+        self.digests = []
+
+    def snapshot(self):
+        self.before = gas_coin_versions()
+        self.digests = []
+
+    def _digests_from_gas_coins(self):
+        if self.before is None:
+            return []
+        after = gas_coin_versions() or {}
+        digests = []
+        for coin_id, version in after.items():
+            if self.gas_coin and coin_id != self.gas_coin:
+                continue
+            if self.before.get(coin_id) != version:
+                data = query_json(['sui', 'client', 'object', coin_id, '--json']) or {}
+                data = data.get('data', data)
+                if data.get('previousTransaction'):
+                    digests.append(data['previousTransaction'])
+        return digests
+
+    def recover(self, error_text):
+        """Return the executed transaction's JSON text, or None if no attempt landed."""
+        match = DIGEST_PATTERN.search(error_text or '')
+        if match and match.group(1) not in self.digests:
+            self.digests.append(match.group(1))
+
+        for digest in dict.fromkeys(self.digests + self._digests_from_gas_coins()):
+            tx = query_json(['sui', 'client', 'tx-block', digest, '--json'])
+            if not isinstance(tx, dict):
+                continue
+            status = tx.get('effects', {}).get('status', {}).get('status')
+            if status == 'success' and self.expect(tx):
+                print_info(f"Found executed transaction {digest}")
+                return json.dumps(tx, indent=2)
         return None
 
 
@@ -335,7 +635,7 @@ def build_and_publish_stablecoin(script_dir, json_dir):
         return None
 
 
-def build_and_publish_package(script_dir, json_dir, package_config):
+def build_and_publish_package(script_dir, json_dir, package_config, gas_coin=None):
     """Generic function to build and publish a package based on configuration."""
     package_name = package_config['name']
     display_name = package_config.get('display_name', package_name)
@@ -350,13 +650,13 @@ def build_and_publish_package(script_dir, json_dir, package_config):
     
     if not package_dir.exists():
         print_error(f"{display_name} directory not found: {package_dir}")
-        return (None, None) if extract_treasury else None
+        return (None, {}) if extract_treasury else None
     
     # Build the package
     print_progress(f"Building {package_name} package...")
-    build_result = run_command(['sui', 'move', 'build', '--build-env', BUILD_ENV], cwd=package_dir)
+    build_result = run_command(['sui', 'move', 'build', '--build-env', BUILD_ENV], cwd=package_dir, step='build')
     if build_result is None:
-        return (None, None) if extract_treasury else None
+        return (None, {}) if extract_treasury else None
 
     # Publish the package. devnet is ephemeral, so use `test-publish`, which
     # publishes to the active network but records addresses in a shared
@@ -373,12 +673,18 @@ def build_and_publish_package(script_dir, json_dir, package_config):
         '--gas-budget', GAS_BUDGET,
         '--json',
     ]
-
-    output = run_command(cmd, cwd=package_dir)
+    if gas_coin:
+        cmd += ['--gas', gas_coin]
+
+    # Only adopt a publish of *this* package: any publish from the active
+    # address (e.g. a concurrent run) would otherwise be taken for ours.
+    modules = package_modules(package_dir)
+    guard = ExecutionGuard(lambda tx: bool(modules) and modules <= published_modules(tx), gas_coin)
+    output = run_command(cmd, cwd=package_dir, step='publish', guard=guard)
     
     if not output:
         print_error(f"Failed to publish {package_name} package.")
-        return (None, None) if extract_treasury else None
+        return (None, {}) if extract_treasury else None
     
     # Save output to JSON file
     with open(output_path, 'w') as f:
@@ -395,22 +701,19 @@ def build_and_publish_package(script_dir, json_dir, package_config):
         else:
             print_error(f"Could not extract {package_name.upper()}_PACKAGE from output.")
         
-        # Extract treasury if needed
-        treasury_id = None
+        # Extract the treasury that each coin's init shared
+        treasury_ids = {}
         if extract_treasury and package_id:
-            # For USDC package, the package_id is the usdc_package we need
-            usdc_to_use = package_id if package_name == 'usdc' else None
-            treasury_id = extract_treasury_id(data, usdc_to_use)
-            if treasury_id:
-                print_contract_id("TREASURY", treasury_id, "🏛️ ")
-            else:
-                print_error("Could not extract TREASURY from output.")
+            for coin in package_config['coins']:
+                treasury_ids[coin['name']] = extract_treasury_id(data, coin_type(coin, package_id))
+                if treasury_ids[coin['name']]:
+                    print_contract_id(f"{env_prefix(coin)}_TREASURY", treasury_ids[coin['name']], "🏛️ ")
         
-        return (package_id, treasury_id) if extract_treasury else package_id
+        return (package_id, treasury_ids) if extract_treasury else package_id
         
     except json.JSONDecodeError as e:
         print_error(f"Failed to parse JSON output: {e}")
-        return (None, None) if extract_treasury else None
+        return (None, {}) if extract_treasury else None
 
 
 def build_and_publish_sui_extensions(script_dir, json_dir):
@@ -439,14 +742,7 @@ def build_and_publish_stablecoin(script_dir, json_dir):
 
 def build_and_publish_usdc(script_dir, json_dir):
     """Build and publish USDC package."""
-    config = {
-        'name': 'usdc',
-        'display_name': 'USDC',
-        'icon': '💰',
-        'needs_unpublished_deps': True,
-        'extract_treasury': True
-    }
-    return build_and_publish_package(script_dir, json_dir, config)
+    return build_and_publish_package(script_dir, json_dir, PackageConfig.get_config('usdc'))
 
 
 def extract_package_id(data):
@@ -459,13 +755,13 @@ def extract_package_id(data):
             return change['packageId']
     return None
 
-def extract_treasury_id(data, usdc_package=None):
-    """Extract Treasury object ID from created objects."""
+def extract_treasury_id(data, coin_type_tag=None):
+    """Extract Treasury object ID from created objects (any coin if coin_type_tag is None)."""
     if not data or 'objectChanges' not in data:
         return None
 
     # Pattern for our specific Treasury type
-    pattern = rf"::treasury::Treasury<{usdc_package}::usdc::USDC>"
+    pattern = rf"::treasury::Treasury<{re.escape(coin_type_tag) if coin_type_tag else '.*'}>"
     
     for change in data['objectChanges']:
         if change.get('type') == 'created' and 'objectType' in change:
@@ -473,16 +769,16 @@ def extract_treasury_id(data, usdc_package=None):
                 print_info(f"✅ Found Treasury: {change['objectType']}")
                 return change['objectId']
     
-    print_error("❌ Could not extract TREASURY from output.")
+    print_error(f"❌ Could not extract TREASURY for {coin_type_tag or 'any coin'} from output.")
     return None
 
 
-def extract_faucet_id(data, usdc_package):
+def extract_faucet_id(data, coin_type_tag):
     """Extract Faucet object ID from created objects."""
-    if not data or 'objectChanges' not in data or not usdc_package:
+    if not data or 'objectChanges' not in data or not coin_type_tag:
         return None
 
-    faucet_pattern = r"::faucet::Faucet<.*::usdc::USDC>"
+    faucet_pattern = rf"::faucet::Faucet<{re.escape(coin_type_tag)}>"
     for change in data['objectChanges']:
         if (change.get('type') == 'created' and 
             'objectType' in change and 
@@ -491,77 +787,15 @@ def extract_faucet_id(data, usdc_package):
     return None
 
 
-def create_treasury(stablecoin_package, usdc_package, owner_address, treasury_json_path):
-    """Create Treasury object using SUI client call and save output to JSON file."""
-    if not all([stablecoin_package, usdc_package, owner_address]):
-        print_error("Missing required parameters for treasury creation.")
-        return None
-
-    print_header("Creating Treasury", Colors.BRIGHT_CYAN)
-    print_info("This will create a Treasury<USDC> object with our specific USDC type.")
-
-    # Build the SUI client command
-    cmd = [
-        'sui', 'client', 'call',
-        '--package', stablecoin_package,
-        '--module', 'treasury',
-        '--function', 'create',
-        '--type-args', f'{usdc_package}::usdc::USDC',
-        '--args', f"{owner_address}",
-        '--gas-budget', GAS_BUDGET,
-        '--json'
-    ]
-
-    try:
-        print_progress("Executing SUI client call to create Treasury...")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-
-        # Save the output to the JSON file
-        with open(treasury_json_path, 'w') as f:
-            f.write(result.stdout)
-
-        print_success("Treasury creation completed successfully!")
-        print_file_action("Output saved", treasury_json_path)
-
-        # Parse and display the treasury ID
-        try:
-            output_data = json.loads(result.stdout)
-            treasury_id = extract_treasury_id(output_data, usdc_package)
-            if treasury_id:
-                print_contract_id("TREASURY_ID", treasury_id, "🏛️ ")
-                return treasury_id
-            else:
-                print_warning("Could not extract TREASURY_ID from the output.")
-                return None
-        except json.JSONDecodeError:
-            print_warning("Could not parse JSON output to extract TREASURY_ID.")
-            return None
-
-    except subprocess.CalledProcessError as e:
-        print_error(f"Error executing SUI client call: {e}")
-        if e.stderr:
-            print_error(f"Error output: {e.stderr}")
-        return None
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        return None
-
-
-def create_faucet(stablecoin_package, usdc_package, treasury_id, faucet_json_path):
+def create_faucet(stablecoin_package, coin_type_tag, treasury_id, faucet_json_path, gas_coin=None):
     """Create faucet using SUI client call and save output to JSON file."""
-    if not all([stablecoin_package, usdc_package, treasury_id]):
+    if not all([stablecoin_package, coin_type_tag, treasury_id]):
         print_error("Missing required parameters for faucet creation.")
-        print_error(f"Required: STABLECOIN_PACKAGE={stablecoin_package}, USDC_PACKAGE={usdc_package}, TREASURY={treasury_id}")
+        print_error(f"Required: STABLECOIN_PACKAGE={stablecoin_package}, COIN_TYPE={coin_type_tag}, TREASURY={treasury_id}")
         return None
     
-    print_header("Creating Faucet", Colors.BRIGHT_CYAN)
-    print_info("This will create a shared Faucet<USDC> object.")
-    
-    # Ask user for confirmation
-    response = input("Do you want to proceed with creating the faucet? (Y/n): ").strip().lower()
-    if response.lower() != 'y' and response.lower() != 'yes':
-        print_warning("Faucet creation cancelled by user.")
-        return None
+    print_header(f"Creating Faucet<{coin_type_tag.split('::')[-1]}>", Colors.BRIGHT_CYAN)
+    print_info(f"This will create a shared Faucet<{coin_type_tag}> object.")
     
     # Build the SUI client command
     cmd = [
@@ -569,47 +803,100 @@ def create_faucet(stablecoin_package, usdc_package, treasury_id, faucet_json_pat
         '--package', stablecoin_package,
         '--module', 'faucet',
         '--function', 'create',
-        '--type-args', f'{usdc_package}::usdc::USDC',
+        '--type-args', coin_type_tag,
         '--args', treasury_id,
         '--gas-budget', GAS_BUDGET,
         '--json'
     ]
+    if gas_coin:
+        cmd += ['--gas', gas_coin]
+    
+    print_progress("Executing SUI client call...")
+    guard = ExecutionGuard(
+        lambda tx: has_created_object(tx, rf"::faucet::Faucet<{re.escape(coin_type_tag)}>"),
+        gas_coin,
+    )
+    output = run_command(cmd, step='call', guard=guard)
+    if not output:
+        print_error("Error executing SUI client call to create Faucet.")
+        return None
     
+    # Save the output to the JSON file
+    with open(faucet_json_path, 'w') as f:
+        f.write(output)
+    
+    print_success("Faucet creation completed successfully!")
+    print_file_action("Output saved", faucet_json_path)
+    
+    # Parse and display the faucet ID
     try:
-        print_progress("Executing SUI client call...")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        
-        # Save the output to the JSON file
-        with open(faucet_json_path, 'w') as f:
-            f.write(result.stdout)
-        
-        print_success("Faucet creation completed successfully!")
-        print_file_action("Output saved", faucet_json_path)
-        
-        # Parse and display the faucet ID
-        try:
-            output_data = json.loads(result.stdout)
-            faucet_id = extract_faucet_id(output_data, usdc_package)
-            if faucet_id:
-                print_contract_id("FAUCET_ID", faucet_id, "🚰")
-                return faucet_id
-            else:
-                print_warning("Could not extract FAUCET_ID from the output.")
-                return None
-        except json.JSONDecodeError:
-            print_warning("Could not parse JSON output to extract FAUCET_ID.")
+        output_data = json.loads(output)
+        faucet_id = extract_faucet_id(output_data, coin_type_tag)
+        if faucet_id:
+            print_contract_id("FAUCET_ID", faucet_id, "🚰")
+            return faucet_id
+        else:
+            print_warning("Could not extract FAUCET_ID from the output.")
             return None
-        
-    except subprocess.CalledProcessError as e:
-        print_error(f"Error executing SUI client call: {e}")
-        if e.stderr:
-            print_error(f"Error output: {e.stderr}")
-        return None
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
+    except json.JSONDecodeError:
+        print_warning("Could not parse JSON output to extract FAUCET_ID.")
         return None
 
 
+def setup_coin_faucets(stablecoin_package, coin_ids, json_dir, gas_coins=()):
+    """Create the Faucet of every coin, concurrently.
+
+    `coin_ids` maps coin name -> {'package', 'treasury_id', 'faucet_id'} and is
+    updated in place. The Treasury comes from the coin package's publish
+    output; a coin without one gets no faucet. Each worker pays from one of
+    this run's `gas_coins`, so there are as many workers as coins (one,
+    letting the CLI pick gas, if none were reserved).
+    """
+    pending = []
+    for coin in COINS:
+        ids = coin_ids[coin['name']]
+        if not ids['package']:
+            continue
+        if not ids['treasury_id']:
+            print_error(f"{coin['display_name']}: no Treasury<{coin_type(coin, ids['package'])}> in the "
+                        "publish output; coin package init must share a Treasury<T>.")
+            continue
+        pending.append(coin)
+    if not pending:
+        return
+
+    names = ', '.join(coin['display_name'] for coin in pending)
+    response = input(f"Do you want to proceed with creating the faucet(s) for {names}? (Y/n): ").strip().lower()
+    if response.lower() != 'y' and response.lower() != 'yes':
+        print_warning("Faucet creation cancelled by user.")
+        return
+
+    free_gas_coins = queue.Queue()
+    for gas_coin in list(gas_coins)[:len(pending)] or [None]:
+        free_gas_coins.put(gas_coin)
+    if len(pending) > 1:
+        print_info(f"Creating {len(pending)} faucets with {free_gas_coins.qsize()} concurrent worker(s).")
+
+    def setup_coin(coin):
+        ids = coin_ids[coin['name']]
+        type_tag = coin_type(coin, ids['package'])
+        gas_coin = free_gas_coins.get()
+        try:
+            ids['faucet_id'] = create_faucet(
+                stablecoin_package, type_tag, ids['treasury_id'],
+                json_dir / f"{coin['name']}.faucet.out.json", gas_coin,
+            )
+        finally:
+            free_gas_coins.put(gas_coin)
+
+    with ThreadPoolExecutor(max_workers=free_gas_coins.qsize()) as executor:
+        for future in [executor.submit(setup_coin, coin) for coin in pending]:
+            try:
+                future.result()
+            except Exception as e:
+                print_error(f"Faucet setup failed: {e}")
+
+
 def clear_stale_pubfile(script_dir):
     """Remove the ephemeral pubfile if it was created for a different chain.
 
@@ -643,19 +930,129 @@ def clear_stale_pubfile(script_dir):
 
 
 def save_config_file(config_data, output_path):
-    """Save extracted IDs to a config file."""
+    """Save extracted IDs to a config file (atomically, so readers never see a partial file)."""
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
     try:
-        with open(output_path, 'w') as f:
+        with open(tmp_path, 'w') as f:
             for key, value in config_data.items():
                 f.write(f"{key}={value}\n")
+        os.replace(tmp_path, output_path)
         print_file_action("Contract IDs saved", output_path)
         return True
     except IOError as e:
         print_error(f"Could not write to config file {output_path}: {e}")
+        tmp_path.unlink(missing_ok=True)
         return False
 
 
-def load_existing_package_data(json_dir, package_config, usdc_package=None):
+class LockTimeout(Exception):
+    """Another build_all.py run kept the deployment lock for too long."""
+
+
+@contextlib.contextmanager
+def deployment_lock(lock_path, timeout=DEFAULT_LOCK_TIMEOUT):
+    """Hold an exclusive advisory (flock) lock on lock_path, waiting up to `timeout` seconds.
+
+    The lock is released automatically if the process dies. The holder's PID
+    is written to the file so that a waiting run can say who it waits for.
+    """
+    with open(lock_path, 'a+') as f:
+        deadline = time.monotonic() + timeout
+        waiting = False
+        while True:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise LockTimeout(f"Timed out after {timeout:.0f}s waiting for {lock_path}")
+                if not waiting:
+                    f.seek(0)
+                    holder = f.read().strip() or 'unknown'
+                    print_progress(f"Waiting for another build_all.py run to release {lock_path.name} ({holder})...")
+                    waiting = True
+                time.sleep(1)
+        try:
+            f.seek(0)
+            f.truncate()
+            f.write(f"pid {os.getpid()}\n")
+            f.flush()
+            yield
+        finally:
+            f.seek(0)
+            f.truncate()
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def claimed_gas_coins(claims_dir):
+    """Gas coin IDs claimed by other live runs; claims left by dead runs are removed."""
+    claimed = set()
+    for path in claims_dir.glob('*.json'):
+        try:
+            with open(path) as f:
+                try:
+                    fcntl.flock(f, fcntl.LOCK_SH | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    claimed.update(json.load(f))
+                    continue
+                path.unlink(missing_ok=True)
+        except (OSError, ValueError):
+            continue
+    return claimed
+
+
+@contextlib.contextmanager
+def claim_gas_coins(claims_dir, count):
+    """Reserve up to `count` gas coins for this run and keep other runs off them.
+
+    Must be called with the deployment lock held. The claim is a file in
+    claims_dir that stays flock'ed until the context exits, so a crashed
+    run's coins become available again.
+    """
+    claims_dir.mkdir(exist_ok=True)
+    gas_coins = reserve_gas_coins(count, exclude=claimed_gas_coins(claims_dir))
+    if gas_coins:
+        print_info(f"Reserved gas coin(s) for this run: {', '.join(gas_coins)}")
+    else:
+        print_warning("Could not reserve gas coins; the sui CLI will pick them, "
+                      "so concurrent runs on this address may conflict.")
+    claim_path = claims_dir / f"{os.getpid()}.json"
+    with open(claim_path, 'w') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        json.dump(gas_coins, f)
+        f.flush()
+        try:
+            yield gas_coins
+        finally:
+            claim_path.unlink(missing_ok=True)
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def default_run_id():
+    """Run ID used when --run-id is given without a value."""
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+
+def prepare_run_workspace(script_dir, run_dir):
+    """Copy packages/ into run_dir so that builds, Move.lock and the pubfile are per run."""
+    run_dir.mkdir(parents=True)
+    shutil.copytree(
+        script_dir / 'packages', run_dir / 'packages',
+        ignore=shutil.ignore_patterns('build'),
+    )
+    (run_dir / 'json').mkdir()
+    print_file_action("Run workspace created", run_dir)
+
+
+def promote_manifest(source_path, target_path):
+    """Atomically replace target_path with a copy of source_path."""
+    tmp_path = target_path.with_name(f".{target_path.name}.{os.getpid()}.tmp")
+    shutil.copyfile(source_path, tmp_path)
+    os.replace(tmp_path, target_path)
+    print_file_action("Manifest promoted", target_path)
+
+
+def load_existing_package_data(json_dir, package_config):
     """Load existing package data from JSON file."""
     package_name = package_config['name']
     display_name = package_config.get('display_name', package_name)
@@ -664,28 +1061,27 @@ def load_existing_package_data(json_dir, package_config, usdc_package=None):
     
     package_data = load_json_file(json_dir / f'{package_name}.out.json')
     if not package_data:
-        return (None, None) if extract_treasury else None
+        return (None, {}) if extract_treasury else None
     
     package_id = extract_package_id(package_data)
-    treasury_id = None
-    
-    # Always attempt to extract Treasury using the README pattern
-    # This does not require usdc_package to be known in advance
-    if extract_treasury and package_id:
-        treasury_id = extract_treasury_id(package_data, usdc_package)
     
     if package_id:
         print_contract_id(f"Loaded existing {package_name.upper()}_PACKAGE", package_id, icon)
     
-    if treasury_id:
-        print_contract_id("Loaded existing TREASURY", treasury_id, "🏛️ ")
+    # The publish output carries the Treasury shared by each coin's init
+    treasury_ids = {}
+    if extract_treasury and package_id:
+        for coin in package_config['coins']:
+            treasury_ids[coin['name']] = extract_treasury_id(package_data, coin_type(coin, package_id))
+            if treasury_ids[coin['name']]:
+                print_contract_id(f"Loaded existing {env_prefix(coin)}_TREASURY", treasury_ids[coin['name']], "🏛️ ")
     
-    return (package_id, treasury_id) if extract_treasury else package_id
+    return (package_id, treasury_ids) if extract_treasury else package_id
 
 
 def check_existing_json_files(json_dir):
     """Check for existing JSON files and ask user whether to use them or create new ones."""
-    json_files = ['sui_extensions.out.json', 'stablecoin.out.json', 'usdc.out.json']
+    json_files = [f"{config['name']}.out.json" for config in PackageConfig.get_all_configs()]
     existing_files = []
     
     for json_file in json_files:
@@ -722,7 +1118,7 @@ def check_existing_json_files(json_dir):
         return {file: True for file in existing_files}
 
 
-def deploy_package_with_prompt(script_dir, json_dir, package_config, usdc_package=None, use_existing_files=None):
+def deploy_package_with_prompt(script_dir, json_dir, package_config, use_existing_files=None, gas_coin=None):
     """Deploy a package with user prompt and handle existing data loading."""
     package_name = package_config['name']
     display_name = package_config['display_name']
@@ -735,119 +1131,200 @@ def deploy_package_with_prompt(script_dir, json_dir, package_config, usdc_packag
     json_file = f"{package_name}.out.json"
     if use_existing_files and json_file in use_existing_files:
         print_info(f"Using existing {json_file} file.")
-        return load_existing_package_data(json_dir, package_config, usdc_package)
+        return load_existing_package_data(json_dir, package_config)
     
     response = input(f"Do you want to build and publish {package_name}? (Y/n): ").strip().lower()
     if response != 'n' and response != 'no':
-        return build_and_publish_package(script_dir, json_dir, package_config)
+        return build_and_publish_package(script_dir, json_dir, package_config, gas_coin)
     else:
         print_warning(f"Skipping {package_name} deployment.")
-        return load_existing_package_data(json_dir, package_config, usdc_package)
+        return load_existing_package_data(json_dir, package_config)
 
 
-def verify_usdc_data_type(usdc_package, treasury_id):
-    """Verify that USDC coins are properly recognized as USDC type, not generic Object."""
-    print_section("🔍 Verifying USDC Data Type")
+def get_rpc_url():
+    """JSON-RPC URL of the active `sui client` environment."""
+    envs = query_json(['sui', 'client', 'envs', '--json'])
+    try:
+        env_list, active = envs
+        for env in env_list:
+            if env.get('alias') == active and env.get('rpc'):
+                return env['rpc']
+    except (TypeError, ValueError, AttributeError):
+        pass
+    fallback = f'https://fullnode.{TARGET_NETWORK}.sui.io:443'
+    print_warning(f"Could not determine active RPC URL; using {fallback}")
+    return fallback
+
+
+def rpc_call(url, method, params):
+    """Call a Sui JSON-RPC method, retrying transient failures per RETRY_POLICIES['query']."""
+    body = json.dumps({'jsonrpc': '2.0', 'id': 1, 'method': method, 'params': params}).encode()
+    policy = RETRY_POLICIES['query']
+    for attempt in range(1, policy['attempts'] + 1):
+        request = urllib.request.Request(url, data=body, headers={'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                reply = json.loads(response.read())
+            if 'error' in reply:
+                raise RuntimeError(f"{method}: {reply['error']}")
+            return reply.get('result')
+        except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+            if attempt == policy['attempts']:
+                raise
+            delay = backoff_delay(policy, attempt)
+            print_warning(f"{method} failed ({e}); retrying in {delay:.1f}s...")
+            time.sleep(delay)
+    return None
+
 
-    if not usdc_package:
-        print_error("USDC package ID not available for verification.")
-        return False
+def normalize_address(address):
+    """Lower-case, 0x-prefixed, zero-padded 32-byte hex address."""
+    if not address:
+        return address
+    hex_part = address.lower().removeprefix('0x')
+    return '0x' + hex_part.rjust(64, '0')
 
-    expected_usdc_type = f"{usdc_package}::usdc::USDC"
-    print_info(f"Expected USDC type: {expected_usdc_type}")
 
-    # Check Treasury object type
-    if treasury_id:
-        print_progress("Checking Treasury object type...")
-        cmd = ['sui', 'client', 'object', treasury_id, '--json']
-        treasury_output = run_command(cmd)
+def normalize_type(type_tag):
+    """Normalize every address inside a Move type tag for exact comparison."""
+    return re.sub(r'0x[0-9a-fA-F]+', lambda m: normalize_address(m.group(0)), type_tag or '')
 
-        if treasury_output:
-            try:
-                treasury_data = json.loads(treasury_output)
-                treasury_type = treasury_data.get('data', {}).get('type', '')
-
-                if treasury_type:
-                    print_info(f"Treasury type: {treasury_type}")
-
-                    if expected_usdc_type in treasury_type:
-                        print_success("✅ Treasury contains correct USDC type!")
-                    else:
-                        print_error(f"❌ Treasury type mismatch! Expected {expected_usdc_type} in {treasury_type}")
-                        return False
-                else:
-                    print_warning("Could not determine Treasury object type.")
-            except json.JSONDecodeError:
-                print_error("Failed to parse Treasury object JSON.")
 
-    # Check if we have any USDC coins in wallet
-    print_progress("Checking wallet for USDC coins...")
-    try:
-        address = run_command(['sui', 'client', 'active-address'], capture_output=True)
-        if address:
-            address = address.strip()
-            print_info(f"Using address: {address}")
+def verify_deployment(package_ids, rpc_url=None):
+    """Verify every deployed object in a single multi-get round trip.
 
-            # Query balance for the specific USDC coin type
-            cmd = ['sui', 'client', 'balance', address, '--coin-type', expected_usdc_type, '--json']
-            balance_output = run_command(cmd)
+    Checks that the packages exist, that each coin's Treasury and Faucet have
+    the exact expected `<STABLECOIN>::...<COIN_PACKAGE::module::Type>` types and
+    are shared, and that every Faucet's `treasury_id` points at its Treasury.
+    Returns a report dict: {'ok': bool, 'checks': [{'check', 'object_id', 'ok', 'detail'}]}.
+    """
+    print_section("🔍 Verifying Deployment")
 
-            if balance_output:
-                try:
-                    data = json.loads(balance_output)
-                    total = 0
-                    if isinstance(data, dict):
-                        total = int(data.get('totalBalance') or data.get('total_balance') or 0)
-                    elif isinstance(data, list):
-                        for entry in data:
-                            if isinstance(entry, dict) and (entry.get('coinType') == expected_usdc_type or entry.get('coin_type') == expected_usdc_type):
-                                total = int(entry.get('totalBalance') or entry.get('total_balance') or 0)
-                                break
-
-                    if total > 0:
-                        print_success(f"✅ Found USDC balance: {total / 1_000_000} USDC")
-                        return True
-                    else:
-                        print_info("ℹ️  No USDC balance found yet. This is normal before using the faucet.")
-                        print_info("   Try requesting USDC from the faucet to test the data type.")
-                        return True
-                except json.JSONDecodeError:
-                    print_error("Failed to parse balance JSON.")
+    stablecoin = normalize_address(package_ids.get('stablecoin_package'))
+    # label -> (object ID, expected type or 'package')
+    objects = {
+        'sui_extensions_package': (package_ids.get('sui_extensions_package'), 'package'),
+        'stablecoin_package': (package_ids.get('stablecoin_package'), 'package'),
+    }
+    for coin in COINS:
+        ids = package_ids['coins'][coin['name']]
+        type_tag = coin_type(coin, normalize_address(ids['package']))
+        objects.setdefault(f"{coin['package']}_package", (ids['package'], 'package'))
+        objects[f"{coin['display_name']} Treasury"] = (
+            ids['treasury_id'], f"{stablecoin}::treasury::Treasury<{type_tag}>")
+        objects[f"{coin['display_name']} Faucet"] = (
+            ids['faucet_id'], f"{stablecoin}::faucet::Faucet<{type_tag}>")
+
+    checks = []
+
+    def check(name, object_id, ok, detail=''):
+        checks.append({'check': name, 'object_id': object_id, 'ok': bool(ok), 'detail': detail})
+
+    for label, (object_id, _) in objects.items():
+        if not object_id:
+            check(f"{label} known", None, False, 'ID missing from deployment results')
+    present = [(label, object_id) for label, (object_id, _) in objects.items() if object_id]
+
+    fetched = {}
+    if present:
+        rpc_url = rpc_url or get_rpc_url()
+        print_progress(f"Fetching {len(present)} objects in one sui_multiGetObjects call...")
+        try:
+            results = rpc_call(rpc_url, 'sui_multiGetObjects', [
+                [object_id for _, object_id in present],
+                {'showType': True, 'showOwner': True, 'showContent': True},
+            ]) or []
+            fetched = {label: result.get('data') for (label, _), result in zip(present, results)}
+        except Exception as e:
+            for label, object_id in present:
+                check(f"{label} exists", object_id, False, f"multi-get failed: {e}")
+            present = []
+
+    for label, object_id in present:
+        expected_type = objects[label][1]
+        data = fetched.get(label)
+        if not data:
+            check(f"{label} exists", object_id, False, 'object not found')
+            continue
+        actual_type = data.get('type', '')
+        if expected_type == 'package':
+            check(f"{label} exists", object_id, actual_type == 'package', f"type: {actual_type}")
+            continue
+        type_ok = normalize_type(actual_type) == expected_type
+        check(f"{label} type", object_id, type_ok,
+              actual_type if type_ok else f"expected {expected_type}, got {actual_type}")
+        owner = data.get('owner')
+        check(f"{label} is shared", object_id, isinstance(owner, dict) and 'Shared' in owner,
+              f"owner: {owner}")
+
+    for coin in COINS:
+        ids = package_ids['coins'][coin['name']]
+        faucet = fetched.get(f"{coin['display_name']} Faucet")
+        if faucet and ids['treasury_id']:
+            fields = (faucet.get('content') or {}).get('fields', {})
+            linked = fields.get('treasury_id')
+            if isinstance(linked, dict):
+                linked = linked.get('id') or linked.get('bytes')
+            check(f"{coin['display_name']} Faucet.treasury_id matches Treasury", ids['faucet_id'],
+                  normalize_address(linked) == normalize_address(ids['treasury_id']),
+                  f"faucet.treasury_id: {linked}")
+
+    for c in checks:
+        line = f"{c['check']}: {c['detail']}" if c['detail'] else c['check']
+        if c['ok']:
+            print_success(line)
         else:
-            print_warning("Could not determine active address.")
-    except Exception as e:
-        print_error(f"Error checking USDC balance: {e}")
+            print_error(line)
 
-    print_info("ℹ️  USDC data type verification completed.")
-    return True
+    return {'ok': bool(checks) and all(c['ok'] for c in checks), 'checks': checks}
 
 
-def main():
-    """Main function to build and deploy all packages following README.md workflow."""
-    print_header("🚀 Starting Comprehensive Build and Deployment Process", Colors.BRIGHT_CYAN)
-    for i, config in enumerate(PackageConfig.get_all_configs(), 1):
-        print_step(i, f"Build & Publish {config['name']}")
-    print_step(4, "Create Treasury")
-    print_step(5, "Create faucet")
-    print_step(6, "Verify USDC data type")
-    print_step(7, "Save all contract IDs")
-    print()
-    
-    # Define file paths
-    script_dir = Path(__file__).parent
-    json_dir = script_dir / 'json'
+def build_config_data(package_ids):
+    """contract_ids.env entries: shared packages, then per-coin IDs.
+
+    The unprefixed USDC_PACKAGE/TREASURY/FAUCET_ID keys the backend and frontend
+    read are kept and point at the first coin in COINS.
+    """
+    primary = package_ids['coins'][COINS[0]['name']]
+    config_data = {
+        'SUI_EXTENSIONS_PACKAGE': package_ids['sui_extensions_package'] or '',
+        'STABLECOIN_PACKAGE': package_ids['stablecoin_package'] or '',
+        'USDC_PACKAGE': primary['package'] or '',
+        'TREASURY': primary['treasury_id'] or '',
+        'FAUCET_ID': primary['faucet_id'] or '',
+        'COINS': ','.join(coin['name'] for coin in COINS),
+    }
+    for coin in COINS:
+        ids = package_ids['coins'][coin['name']]
+        prefix = env_prefix(coin)
+        config_data[f'{prefix}_PACKAGE'] = ids['package'] or ''
+        config_data[f'{prefix}_COIN_TYPE'] = coin_type(coin, ids['package']) if ids['package'] else ''
+        config_data[f'{prefix}_DECIMALS'] = coin['decimals']
+        config_data[f'{prefix}_TREASURY'] = ids['treasury_id'] or ''
+        config_data[f'{prefix}_FAUCET_ID'] = ids['faucet_id'] or ''
+    return config_data
+
+
+def run_deployment(workspace_dir, json_dir, run_id=None, gas_coins=()):
+    """Publish every package, set up the faucets, verify, and save contract_ids.env.
+
+    workspace_dir holds packages/ and the ephemeral pubfile: the script
+    directory, or a run's private copy in --run-id mode. Transactions pay from
+    `gas_coins` (publishes from the first). Returns the verification report,
+    or None if the configuration file was not saved.
+    """
     config_output_path = json_dir / 'contract_ids.env'
     
     # Create json directory if it doesn't exist
     json_dir.mkdir(exist_ok=True)
     
-    print_info(f"Working directory: {script_dir}")
+    print_info(f"Working directory: {workspace_dir}")
     print_info(f"JSON output directory: {json_dir}")
     print_info(f"Configuration output: {config_output_path}")
     print()
     
     # Drop an ephemeral pubfile left over from a previous (now-reset) devnet.
-    clear_stale_pubfile(script_dir)
+    clear_stale_pubfile(workspace_dir)
 
     # Check for existing JSON files
     use_existing_files = check_existing_json_files(json_dir)
@@ -857,84 +1334,129 @@ def main():
     package_ids = {
         'sui_extensions_package': None,
         'stablecoin_package': None,
-        'usdc_package': None,
-        'treasury_id': None,
-        'faucet_id': None
+        'coins': {
+            coin['name']: {'package': None, 'treasury_id': None, 'faucet_id': None}
+            for coin in COINS
+        },
     }
     
-    # Deploy packages using configuration
+    # Deploy packages using configuration. Publishing stays sequential: every
+    # publish updates the shared pubfile that later packages resolve deps from.
     for package_config in PackageConfig.get_all_configs():
         package_name = package_config['name']
-        result = deploy_package_with_prompt(script_dir, json_dir, package_config, package_ids['usdc_package'], use_existing_files)
+        result = deploy_package_with_prompt(workspace_dir, json_dir, package_config, use_existing_files,
+                                            gas_coins[0] if gas_coins else None)
         
         if package_config['extract_treasury']:
-            package_ids[f"{package_name}_package"], package_ids['treasury_id'] = result
+            package_id, treasury_ids = result
+            for coin in package_config['coins']:
+                package_ids['coins'][coin['name']]['package'] = package_id
+                package_ids['coins'][coin['name']]['treasury_id'] = treasury_ids.get(coin['name'])
         else:
             package_ids[f"{package_name}_package"] = result
     
-    # Step 4: Create Treasury
-    if package_ids['usdc_package'] and not package_ids['treasury_id']:
-        print_section("Creating Treasury")
-        # Get owner address (use active address)
-        owner_address = run_command(['sui', 'client', 'active-address'], capture_output=True).strip()
-        treasury_path = json_dir / 'treasury.out.json'
-        package_ids['treasury_id'] = create_treasury(
-            package_ids['stablecoin_package'],
-            package_ids['usdc_package'],
-            owner_address,
-            treasury_path
-        )
-
-    # Step 5: Create Faucet
-    if package_ids['usdc_package'] and package_ids['treasury_id']:
-        faucet_path = json_dir / 'faucet.out.json'
-        package_ids['faucet_id'] = create_faucet(
-            package_ids['stablecoin_package'],
-            package_ids['usdc_package'],
-            package_ids['treasury_id'],  # Use our newly created Treasury
-            faucet_path
-        )
+    # Step 4: Create the Faucets, one worker per coin
+    print_section("Creating Faucets")
+    setup_coin_faucets(package_ids['stablecoin_package'], package_ids['coins'], json_dir, gas_coins)
     
-    # Step 6: Verify USDC data type
-    print_section("STEP 6: Verifying USDC Data Type")
-    verification_success = verify_usdc_data_type(package_ids['usdc_package'], package_ids['treasury_id'])
-
-    if verification_success:
-        print_success("✅ USDC data type verification passed!")
+    # Step 5: Verify packages, treasuries and faucets
+    print_section("STEP 5: Verifying Deployment")
+    report = verify_deployment(package_ids)
+    report_path = json_dir / 'verification.json'
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print_file_action("Verification report saved", report_path)
+
+    if report['ok']:
+        print_success("✅ Deployment verification passed!")
     else:
-        print_warning("⚠️  USDC data type verification failed. Check the output above for details.")
-        print_info("   This may indicate TypeMismatch issues when using USDC in other projects.")
+        failed = sum(1 for c in report['checks'] if not c['ok'])
+        print_warning(f"⚠️  Deployment verification failed ({failed} check(s)). Check the output above for details.")
+        print_info("   This may indicate TypeMismatch issues when using these coins in other projects.")
     print()
 
     # Display final results
-    print_final_results({
-        'sui_extensions_package': package_ids['sui_extensions_package'],
-        'stablecoin_package': package_ids['stablecoin_package'],
-        'usdc_package': package_ids['usdc_package'],
-        'treasury_id': package_ids['treasury_id'],
-        'faucet_id': package_ids['faucet_id']
-    })
-    
-    if package_ids['usdc_package']:
-        print_info(f"USDC Contract Address: {package_ids['usdc_package']}::usdc::USDC")
+    print_final_results(package_ids)
     
     # Prepare config data
-    config_data = {
-        'SUI_EXTENSIONS_PACKAGE': package_ids['sui_extensions_package'] or '',
-        'STABLECOIN_PACKAGE': package_ids['stablecoin_package'] or '',
-        'USDC_PACKAGE': package_ids['usdc_package'] or '',
-        'TREASURY': package_ids['treasury_id'] or '',
-        'FAUCET_ID': package_ids['faucet_id'] or ''
-    }
+    config_data = build_config_data(package_ids)
+    if run_id:
+        config_data['RUN_ID'] = run_id
     
     # Save to config file
     print_progress(f"Saving configuration to {config_output_path}...")
-    if save_config_file(config_data, config_output_path):
-        print_success("Build and deployment process completed successfully!")
-        print_success("All contract IDs have been extracted and saved!")
-        return 0
-    else:
+    if not save_config_file(config_data, config_output_path):
         print_error("Failed to save configuration file.")
+        return None
+    print_success("All contract IDs have been extracted and saved!")
+    return report
+
+
+def main(argv=None):
+    """Main function to build and deploy all packages following README.md workflow."""
+    parser = argparse.ArgumentParser(description='Build, publish and set up the stablecoin faucets.')
+    parser.add_argument('--run-id', nargs='?', const='', default=None, metavar='ID',
+                        help='isolated run: build, publish and write outputs under '
+                             f'{RUNS_DIR_NAME}/<ID>/ (ID defaults to a timestamp), then '
+                             'promote only contract_ids.env into json/')
+    parser.add_argument('--lock-timeout', type=float, default=DEFAULT_LOCK_TIMEOUT,
+                        help='seconds to wait for another run holding the lock (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    print_header("🚀 Starting Comprehensive Build and Deployment Process", Colors.BRIGHT_CYAN)
+    print_step(1, "Build & Publish sui_extensions")
+    print_step(2, "Build & Publish stablecoin")
+    print_step(3, f"Build & Publish coin packages ({', '.join(c['name'] for c in PackageConfig.get_coin_package_configs())})")
+    print_step(4, "Create faucet (per coin, concurrently)")
+    print_step(5, "Verify deployment")
+    print_step(6, "Save all contract IDs")
+    print()
+    
+    # Define file paths
+    script_dir = Path(__file__).parent
+    json_dir = script_dir / 'json'
+    json_dir.mkdir(exist_ok=True)
+    lock_path = json_dir / LOCK_FILE_NAME
+    claims_dir = json_dir / GAS_CLAIMS_DIR_NAME
+
+    try:
+        if args.run_id is None:
+            # Shared mode: json/, the pubfile and packages/*/build are used in place.
+            with deployment_lock(lock_path, args.lock_timeout), \
+                    claim_gas_coins(claims_dir, len(COINS)) as gas_coins:
+                report = run_deployment(script_dir, json_dir, gas_coins=gas_coins)
+            if report is None:
+                return 1
+            print_success("Build and deployment process completed successfully!")
+            return 0
+
+        run_id = args.run_id or default_run_id()
+        if not re.fullmatch(r'[\w-][\w.-]*', run_id):
+            print_error(f"Invalid run ID {run_id!r}: use letters, digits, '.', '_' or '-'.")
+            return 1
+        run_dir = script_dir / RUNS_DIR_NAME / run_id
+        if run_dir.exists():
+            print_error(f"Run directory already exists: {run_dir}")
+            return 1
+
+        print_info(f"Isolated run {run_id}: workspace {run_dir}")
+        with contextlib.ExitStack() as claim:
+            with deployment_lock(lock_path, args.lock_timeout):
+                prepare_run_workspace(script_dir, run_dir)
+                # Reserved under the lock so no other run can take the same coins
+                gas_coins = claim.enter_context(claim_gas_coins(claims_dir, len(COINS)))
+            report = run_deployment(run_dir, run_dir / 'json', run_id, gas_coins)
+        if report is None:
+            return 1
+        if not report['ok']:
+            print_warning(f"Verification failed; not promoting. Run outputs are in {run_dir / 'json'}")
+            return 1
+        with deployment_lock(lock_path, args.lock_timeout):
+            promote_manifest(run_dir / 'json' / 'contract_ids.env', json_dir / 'contract_ids.env')
+        print_success(f"Build and deployment process completed successfully! (run {run_id})")
+        return 0
+    except LockTimeout as e:
+        print_error(str(e))
         return 1
 
 
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Gas-cost regression harness for the faucet mint path.
+
+Runs the `gas__*` Move unit tests in packages/stablecoin/tests/faucet_gas_tests.move
+under `sui move test --statistics`, derives the cost of each entry point and
+scenario from the differences between tests, and compares the results with
+the committed baseline (gas_baseline.json).
+
+Measured (per scenario, net of the shared setup):
+  - faucet::create
+  - faucet::request_for, first-time user (new rate-limit table entries)
+  - faucet::request_for, repeat user (existing entries updated)
+  - treasury::mint_and_transfer
+
+Unit tests report the Move VM's gas units (computation) only. With
+--network, storage is measured too: a fresh sender, funded from the active
+address, sends a first-time and a repeat `request_for` on the active `sui
+client` network (e.g. `./run.sh start_network`, deployed with build_all.py),
+and the net storage charge (storageCost - storageRebate, in MIST) of each is
+read from the effects.
+
+A measured metric without a recorded baseline value (null) fails the check.
+
+Usage:
+    python3 gas_report.py                    # compare with gas_baseline.json
+    python3 gas_report.py --network          # include storage, on the active network
+    python3 gas_report.py --tolerance 2      # fail on > 2% increase
+    python3 gas_report.py --update-baseline  # record current numbers
+"""
+
+import argparse
+import json
+import re
+import secrets
+import subprocess
+import sys
+import urllib.error
+from pathlib import Path
+
+import sui_tx
+from build_all import (
+    GAS_BUDGET,
+    Colors,
+    gas_coin_balances,
+    get_rpc_url,
+    print_error,
+    print_header,
+    print_info,
+    print_success,
+    print_warning,
+    rpc_call,
+    run_command,
+)
+
+SCRIPT_DIR = Path(__file__).parent
+PACKAGE_DIR = SCRIPT_DIR / 'packages' / 'stablecoin'
+BASELINE_PATH = SCRIPT_DIR / 'gas_baseline.json'
+CONTRACT_IDS_PATH = SCRIPT_DIR / 'json' / 'contract_ids.env'
+TEST_MODULE = 'faucet_gas_tests'
+DEFAULT_TOLERANCE_PCT = 5.0
+
+# metric name -> (scenario test, test it is measured against)
+SCENARIOS = {
+    'faucet::create': ('gas__faucet_create', 'gas__baseline_setup'),
+    'faucet::request_for (first-time user)': ('gas__request_for_first_time', 'gas__faucet_create'),
+    'faucet::request_for (repeat user)': ('gas__request_for_repeat', 'gas__request_for_first_time'),
+    'treasury::mint_and_transfer': ('gas__mint_and_transfer', 'gas__baseline_setup'),
+}
+
+# Net storage (MIST) of consecutive request_for calls from one fresh sender
+NETWORK_SCENARIOS = (
+    'faucet::request_for (first-time user), net storage',
+    'faucet::request_for (repeat user), net storage',
+)
+NETWORK_REQUEST_AMOUNT = 50_000_000
+NETWORK_GAS_BUDGET = 100_000_000
+NETWORK_FUNDING = 1_000_000_000
+
+STAT_LINE = re.compile(rf'{TEST_MODULE}::(gas__\w+)\b.*?(\d+)\D*$')
+
+
+def run_gas_tests():
+    """Run the gas scenario tests and return {test name: gas used}."""
+    cmd = ['sui', 'move', 'test', 'gas__', '--path', str(PACKAGE_DIR), '--build-env', 'testnet',
+           '--statistics']
+    print_info(f"Executing: {' '.join(cmd)}")
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    except FileNotFoundError:
+        print_error("`sui` CLI not found on PATH.")
+        return None
+    except subprocess.CalledProcessError as e:
+        print_error(f"Gas tests failed with exit code {e.returncode}")
+        print_error(e.stdout[-2000:] if e.stdout else e.stderr[-2000:])
+        return None
+
+    gas = {}
+    for line in result.stdout.splitlines():
+        match = STAT_LINE.search(line)
+        if match:
+            gas[match.group(1)] = int(match.group(2))
+    return gas
+
+
+def derive_costs(gas):
+    """Net gas per metric from raw per-test gas."""
+    costs = {}
+    for metric, (test, base) in SCENARIOS.items():
+        if test in gas and base in gas:
+            costs[metric] = gas[test] - gas[base]
+        else:
+            print_warning(f"Missing statistics for {test} or {base}; skipping {metric}.")
+    return costs
+
+
+def load_contract_ids(path):
+    """KEY=VALUE pairs from build_all.py's contract_ids.env."""
+    ids = {}
+    for line in path.read_text().splitlines():
+        key, sep, value = line.partition('=')
+        if sep and not key.startswith('#'):
+            ids[key.strip()] = value.strip()
+    return ids
+
+
+def fund_address(address, amount):
+    """Send `amount` MIST from the active address to `address`; returns the new coin's ObjectRef."""
+    balances = gas_coin_balances() or {}
+    if not balances:
+        print_error("Could not list the active address's gas coins.")
+        return None
+    source = max(balances, key=balances.get)
+    output = run_command([
+        'sui', 'client', 'pay-sui',
+        '--input-coins', source,
+        '--recipients', address,
+        '--amounts', str(amount),
+        '--gas-budget', GAS_BUDGET,
+        '--json',
+    ], step='call')
+    if not output:
+        return None
+    for change in json.loads(output).get('objectChanges', []):
+        owner = change.get('owner')
+        if change.get('type') == 'created' and isinstance(owner, dict) and owner.get('AddressOwner') == address:
+            return sui_tx.ObjectRef(change['objectId'], int(change['version']), change['digest'])
+    print_error(f"pay-sui output has no coin created for {address}.")
+    return None
+
+
+def shared_object(rpc_url, object_id, mutable):
+    """SharedObject input for object_id, with its initial shared version read from the node."""
+    obj = rpc_call(rpc_url, 'sui_getObject', [object_id, {'showOwner': True}]) or {}
+    owner = (obj.get('data') or {}).get('owner')
+    if not isinstance(owner, dict) or 'Shared' not in owner:
+        raise RuntimeError(f"{object_id} is not a shared object")
+    return sui_tx.SharedObject(object_id, int(owner['Shared']['initial_shared_version']), mutable)
+
+
+def measure_network_storage(contract_ids_path):
+    """Net storage of a first-time and a repeat request_for on the active network.
+
+    Returns {metric: MIST} for NETWORK_SCENARIOS, or None on failure.
+    """
+    if not contract_ids_path.exists():
+        print_error(f"{contract_ids_path} not found; deploy with build_all.py first.")
+        return None
+    ids = load_contract_ids(contract_ids_path)
+    missing = [key for key in ('STABLECOIN_PACKAGE', 'USDC_PACKAGE', 'TREASURY', 'FAUCET_ID') if not ids.get(key)]
+    if missing:
+        print_error(f"{contract_ids_path} is missing {', '.join(missing)}.")
+        return None
+    coin_type_tag = ids.get('USDC_COIN_TYPE') or f"{ids['USDC_PACKAGE']}::usdc::USDC"
+
+    rpc_url = get_rpc_url()
+    print_info(f"Measuring storage on {rpc_url} with a fresh sender...")
+    # A new key has no rate-limit entries yet, so its first request is a first-time user's
+    keypair = sui_tx.Keypair(secrets.token_bytes(32))
+    gas = fund_address(keypair.address, NETWORK_FUNDING)
+    if gas is None:
+        return None
+
+    costs = {}
+    try:
+        faucet = shared_object(rpc_url, ids['FAUCET_ID'], True)
+        treasury = shared_object(rpc_url, ids['TREASURY'], True)
+        gas_price = int(rpc_call(rpc_url, 'suix_getReferenceGasPrice', []))
+        for metric in NETWORK_SCENARIOS:
+            tx_bytes = sui_tx.faucet_request_for(
+                keypair.address, [gas], gas_price, ids['STABLECOIN_PACKAGE'], coin_type_tag,
+                faucet, treasury, keypair.address, NETWORK_REQUEST_AMOUNT,
+                gas_budget=NETWORK_GAS_BUDGET,
+            )
+            result = sui_tx.execute_transaction(rpc_url, tx_bytes, keypair.sign_transaction(tx_bytes))
+            effects = result.get('effects') or {}
+            status = effects.get('status') or {}
+            if status.get('status') != 'success':
+                print_error(f"request_for failed: {status.get('error', status)}")
+                return None
+            used = effects['gasUsed']
+            costs[metric] = int(used['storageCost']) - int(used['storageRebate'])
+            ref = effects['gasObject']['reference']
+            gas = sui_tx.ObjectRef(ref['objectId'], int(ref['version']), ref['digest'])
+    except (urllib.error.URLError, RuntimeError, KeyError, TypeError, ValueError) as e:
+        print_error(f"Storage measurement failed: {e}")
+        return None
+    return costs
+
+
+def compare(costs, baseline, tolerance_pct):
+    """Print a comparison table; returns True when every metric has a baseline and none regressed beyond tolerance."""
+    print_header("GAS REPORT", Colors.BRIGHT_CYAN)
+    print(f"{'metric':<52}{'gas':>12}{'baseline':>12}{'delta':>10}")
+    ok = True
+    for metric, value in costs.items():
+        base = baseline.get(metric)
+        if base is None:
+            ok = False
+            print(f"{Colors.BRIGHT_YELLOW}{metric:<52}{value:>12}{'-':>12}{'unset':>10}{Colors.RESET}")
+            continue
+        delta_pct = (value - base) / abs(base) * 100 if base else 0.0
+        line = f"{metric:<52}{value:>12}{base:>12}{delta_pct:>+9.1f}%"
+        if delta_pct > tolerance_pct:
+            ok = False
+            print(f"{Colors.BRIGHT_RED}{line}{Colors.RESET}")
+        elif delta_pct < -tolerance_pct:
+            print(f"{Colors.BRIGHT_GREEN}{line}{Colors.RESET}")
+        else:
+            print(line)
+    for metric in sorted(baseline.keys() - costs.keys()):
+        print_warning(f"{metric} is in the baseline but was not measured.")
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Faucet gas-cost regression check.')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE_PCT,
+                        help='allowed increase over baseline, in percent')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='write the measured numbers to gas_baseline.json')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    parser.add_argument('--network', action='store_true',
+                        help='also measure request_for storage cost on the active `sui client` network')
+    parser.add_argument('--contract-ids', type=Path, default=CONTRACT_IDS_PATH,
+                        help='deployment to use with --network (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    gas = run_gas_tests()
+    if gas is None:
+        return 1
+    costs = derive_costs(gas)
+    if not costs:
+        print_error("No gas statistics found in `sui move test` output.")
+        return 1
+    if args.network:
+        storage = measure_network_storage(args.contract_ids)
+        if storage is None:
+            return 1
+        costs.update(storage)
+
+    if args.update_baseline:
+        # Keep recorded metrics this run did not measure (e.g. storage without --network)
+        baseline = {}
+        if args.baseline.exists():
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(costs)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        compare(costs, costs, args.tolerance)
+        print_success(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        compare(costs, {}, args.tolerance)
+        print_warning(f"No baseline at {args.baseline}; run with --update-baseline and commit it.")
+        return 1
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if compare(costs, baseline, args.tolerance):
+        print_success(f"No gas regressions beyond {args.tolerance}%.")
+        return 0
+    unrecorded = [metric for metric in costs if baseline.get(metric) is None]
+    if unrecorded:
+        print_error(f"No baseline recorded for: {', '.join(unrecorded)}. "
+                    "Run with --update-baseline and commit gas_baseline.json.")
+        return 1
+    print_error(f"Gas regression beyond {args.tolerance}% — update the baseline only if intended.")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,159 @@
+/// Gas scenarios for the faucet mint path, measured by `gas_report.py`.
+///
+/// Every `gas__*` test repeats the previous scenario's transactions and adds one
+/// more, so the difference between two tests is the cost of that one step
+/// (e.g. request_for_repeat - request_for_first_time = a repeat user's mint).
+/// Keep the shared prefix identical when editing these tests, and keep
+/// assertions out of them: checks on a scenario's outcome go in tests whose
+/// names do not contain `gas__`, so `gas_report.py` never measures them.
+#[test_only]
+module stablecoin::faucet_gas_tests {
+    use std::unit_test;
+    use std::string;
+    use sui::{
+        clock,
+        coin::Coin,
+        coin_registry,
+        deny_list,
+        test_scenario::{Self, Scenario},
+    };
+    use stablecoin::{
+        faucet::{Self, Faucet},
+        treasury::{Self, Treasury},
+    };
+
+    const DEPLOYER: address = @0x0;
+    const USER: address = @0x50;
+    const RECIPIENT: address = @0x60;
+    const AMOUNT: u64 = 50_000_000;
+
+    public struct FAUCET_GAS_TESTS has drop {}
+
+    #[test]
+    fun gas__baseline_setup() {
+        let scenario = setup();
+        scenario.end();
+    }
+
+    #[test]
+    fun gas__faucet_create() {
+        let mut scenario = setup();
+        create_faucet(&mut scenario);
+        scenario.end();
+    }
+
+    #[test]
+    fun gas__request_for_first_time() {
+        let mut scenario = setup();
+        create_faucet(&mut scenario);
+        request_for(&mut scenario, 1_000);
+        scenario.end();
+    }
+
+    #[test]
+    fun gas__request_for_repeat() {
+        let mut scenario = setup();
+        create_faucet(&mut scenario);
+        request_for(&mut scenario, 1_000);
+        request_for(&mut scenario, 2_000);
+        scenario.end();
+    }
+
+    #[test]
+    fun gas__mint_and_transfer() {
+        let mut scenario = setup();
+        mint_and_transfer(&mut scenario);
+        scenario.end();
+    }
+
+    // === Scenario checks (not measured) ===
+
+    #[test]
+    fun request_for_repeat_distributes_both_requests() {
+        let mut scenario = setup();
+        create_faucet(&mut scenario);
+        request_for(&mut scenario, 1_000);
+        request_for(&mut scenario, 2_000);
+
+        scenario.next_tx(RECIPIENT);
+        let faucet = scenario.take_shared<Faucet<FAUCET_GAS_TESTS>>();
+        unit_test::assert_eq!(faucet.total_distributed(), 2 * AMOUNT);
+        test_scenario::return_shared(faucet);
+        scenario.end();
+    }
+
+    #[test]
+    fun mint_and_transfer_credits_recipient() {
+        let mut scenario = setup();
+        mint_and_transfer(&mut scenario);
+
+        scenario.next_tx(RECIPIENT);
+        let coin = scenario.take_from_sender<Coin<FAUCET_GAS_TESTS>>();
+        unit_test::assert_eq!(coin.value(), AMOUNT);
+        scenario.return_to_sender(coin);
+        scenario.end();
+    }
+
+    // === Helpers ===
+
+    fun setup(): Scenario {
+        let mut scenario = test_scenario::begin(DEPLOYER);
+        {
+            deny_list::create_for_testing(scenario.ctx());
+            let otw = sui::test_utils::create_one_time_witness<FAUCET_GAS_TESTS>();
+            let (mut currency_init, treasury_cap) = coin_registry::new_currency_with_otw(
+                otw,
+                6,
+                string::utf8(b"SYMBOL"),
+                string::utf8(b"NAME"),
+                string::utf8(b""),
+                string::utf8(b""),
+                scenario.ctx()
+            );
+            let deny_cap = currency_init.make_regulated(true, scenario.ctx());
+            let metadata_cap = currency_init.finalize(scenario.ctx());
+
+            let treasury = treasury::new(
+                treasury_cap,
+                deny_cap,
+                DEPLOYER,
+                DEPLOYER,
+                DEPLOYER,
+                DEPLOYER,
+                DEPLOYER,
+                scenario.ctx()
+            );
+            transfer::public_share_object(metadata_cap);
+            transfer::public_share_object(treasury);
+        };
+        scenario
+    }
+
+    fun create_faucet(scenario: &mut Scenario) {
+        scenario.next_tx(DEPLOYER);
+        let treasury = scenario.take_shared<Treasury<FAUCET_GAS_TESTS>>();
+        faucet::create(&treasury, scenario.ctx());
+        test_scenario::return_shared(treasury);
+    }
+
+    fun request_for(scenario: &mut Scenario, now_ms: u64) {
+        scenario.next_tx(USER);
+        let mut faucet = scenario.take_shared<Faucet<FAUCET_GAS_TESTS>>();
+        let mut treasury = scenario.take_shared<Treasury<FAUCET_GAS_TESTS>>();
+        let mut clock = clock::create_for_testing(scenario.ctx());
+        clock.set_for_testing(now_ms);
+
+        faucet::request_for(&mut faucet, &mut treasury, RECIPIENT, AMOUNT, &clock, scenario.ctx());
+
+        clock.destroy_for_testing();
+        test_scenario::return_shared(faucet);
+        test_scenario::return_shared(treasury);
+    }
+
+    fun mint_and_transfer(scenario: &mut Scenario) {
+        scenario.next_tx(USER);
+        let mut treasury = scenario.take_shared<Treasury<FAUCET_GAS_TESTS>>();
+        treasury::mint_and_transfer(&mut treasury, AMOUNT, RECIPIENT, scenario.ctx());
+        test_scenario::return_shared(treasury);
+    }
+}
@@ -72,6 +72,14 @@ function test() {
   done
 }
 
+function gas_report() {
+  # Compares faucet/treasury gas costs with gas_baseline.json (extra args are passed through;
+  # --network adds request_for storage cost, measured on the active network, e.g. after start_network).
+  if ! python3 gas_report.py "$@"; then
+    exit 1
+  fi
+}
+
 function start_network() {
   LOG_FILE="$PWD/sui-node.log"
 
@@ -0,0 +1,546 @@
+#!/usr/bin/env python3
+"""
+Offline builder and signer for Sui programmable transactions (faucet calls).
+
+Builds BCS-encoded `TransactionData` for `faucet::create` and
+`faucet::request_for` without the `sui` CLI or a fullnode, and signs them
+with an ed25519 key given in any format backend/src/server.js accepts:
+  - suiprivkey1...      (bech32)
+  - ed25519:<base64>    (32-byte secret, optionally flag-prefixed)
+  - hex, 32 or 64 bytes (with or without 0x; 64 = expanded, first 32 used)
+
+Everything a fullnode would normally resolve must be supplied by the caller:
+shared objects' initial versions, the gas coin reference and the gas price.
+
+Bulk mints: RequestForTemplate encodes everything except recipient, amount and
+gas payment once, so each additional transaction only splices 40 bytes of
+arguments plus the gas data into precomputed byte strings.
+
+Standard library only. Signing uses the `cryptography` package when it is
+installed and falls back to a pure-Python RFC 8032 implementation otherwise.
+
+Example:
+    python3 sui_tx.py request-for --key "$SUI_PRIVATE_KEY" --stablecoin 0x.. \\
+        --coin-type 0x..::usdc::USDC --faucet 0x..:12 --treasury 0x..:11 \\
+        --gas 0x..:34:<digest> --gas-price 1000 --recipient 0x.. --amount 50000000
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import re
+import sys
+import urllib.request
+from collections import namedtuple
+
+DEFAULT_GAS_BUDGET = 10_000_000
+SUI_CLOCK = '0x6'
+CLOCK_INITIAL_SHARED_VERSION = 1
+
+ED25519_FLAG = 0x00
+# IntentMessage<TransactionData>: scope TransactionData, version V0, app Sui
+TRANSACTION_INTENT = bytes([0, 0, 0])
+
+# === BCS primitives ===
+
+def uleb128(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def u8(value):
+    return value.to_bytes(1, 'little')
+
+
+def u16(value):
+    return value.to_bytes(2, 'little')
+
+
+def u64(value):
+    return int(value).to_bytes(8, 'little')
+
+
+def bcs_bool(value):
+    return b'\x01' if value else b'\x00'
+
+
+def bcs_bytes(data):
+    return uleb128(len(data)) + data
+
+
+def bcs_str(text):
+    return bcs_bytes(text.encode())
+
+
+def bcs_vec(items):
+    """`items` are already-encoded elements."""
+    return uleb128(len(items)) + b''.join(items)
+
+
+def address_bytes(address):
+    """32-byte Sui address/object ID from 0x-hex (short forms are zero-padded)."""
+    hex_part = address.lower().removeprefix('0x')
+    if not hex_part or len(hex_part) > 64 or not re.fullmatch(r'[0-9a-f]+', hex_part):
+        raise ValueError(f"Invalid Sui address: {address!r}")
+    return bytes.fromhex(hex_part.rjust(64, '0'))
+
+
+def normalize_address(address):
+    return '0x' + address_bytes(address).hex()
+
+
+# === base58 / bech32 ===
+
+B58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+B58_INDEX = {c: i for i, c in enumerate(B58_ALPHABET)}
+
+
+def b58encode(data):
+    n = int.from_bytes(data, 'big')
+    out = ''
+    while n:
+        n, rem = divmod(n, 58)
+        out = B58_ALPHABET[rem] + out
+    pad = len(data) - len(data.lstrip(b'\x00'))
+    return '1' * pad + out
+
+
+def b58decode(text):
+    n = 0
+    for c in text:
+        n = n * 58 + B58_INDEX[c]
+    pad = len(text) - len(text.lstrip('1'))
+    body = n.to_bytes((n.bit_length() + 7) // 8, 'big') if n else b''
+    return b'\x00' * pad + body
+
+
+BECH32_CHARSET = 'qpzry9x8gf2tvdw0s3jn54khce6mua7l'
+BECH32_GEN = (0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)
+
+
+def _bech32_polymod(values):
+    chk = 1
+    for value in values:
+        top = chk >> 25
+        chk = (chk & 0x1FFFFFF) << 5 ^ value
+        for i, gen in enumerate(BECH32_GEN):
+            chk ^= gen if (top >> i) & 1 else 0
+    return chk
+
+
+def _bech32_hrp_expand(hrp):
+    return [ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp]
+
+
+def _convert_bits(data, from_bits, to_bits, pad):
+    acc = bits = 0
+    out = []
+    maxv = (1 << to_bits) - 1
+    for value in data:
+        acc = (acc << from_bits) | value
+        bits += from_bits
+        while bits >= to_bits:
+            bits -= to_bits
+            out.append((acc >> bits) & maxv)
+    if pad and bits:
+        out.append((acc << (to_bits - bits)) & maxv)
+    elif not pad and (bits >= from_bits or (acc << (to_bits - bits)) & maxv):
+        raise ValueError("Invalid bech32 padding")
+    return out
+
+
+def bech32_decode(text):
+    """Decode a bech32 string into (hrp, payload bytes)."""
+    text = text.lower()
+    hrp, _, data = text.rpartition('1')
+    if not hrp or len(data) < 6:
+        raise ValueError("Invalid bech32 string")
+    values = [BECH32_CHARSET.index(c) for c in data]
+    if _bech32_polymod(_bech32_hrp_expand(hrp) + values) != 1:
+        raise ValueError("Invalid bech32 checksum")
+    return hrp, bytes(_convert_bits(values[:-6], 5, 8, pad=False))
+
+
+def bech32_encode(hrp, payload):
+    values = _convert_bits(payload, 8, 5, pad=True)
+    polymod = _bech32_polymod(_bech32_hrp_expand(hrp) + values + [0] * 6) ^ 1
+    checksum = [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+    return hrp + '1' + ''.join(BECH32_CHARSET[v] for v in values + checksum)
+
+
+# === ed25519 (RFC 8032) ===
+
+_P = 2 ** 255 - 19
+_L = 2 ** 252 + 27742317777372353535851937790883648493
+_D = -121665 * pow(121666, _P - 2, _P) % _P
+_SQRT_M1 = pow(2, (_P - 1) // 4, _P)
+
+
+def _point_add(p, q):
+    a = (p[1] - p[0]) * (q[1] - q[0]) % _P
+    b = (p[1] + p[0]) * (q[1] + q[0]) % _P
+    c = 2 * p[3] * q[3] * _D % _P
+    d = 2 * p[2] * q[2] % _P
+    e, f, g, h = b - a, d - c, d + c, b + a
+    return (e * f, g * h, f * g, e * h)
+
+
+def _point_mul(scalar, point):
+    result = (0, 1, 1, 0)
+    while scalar:
+        if scalar & 1:
+            result = _point_add(result, point)
+        point = _point_add(point, point)
+        scalar >>= 1
+    return result
+
+
+def _point_compress(point):
+    zinv = pow(point[2], _P - 2, _P)
+    x, y = point[0] * zinv % _P, point[1] * zinv % _P
+    return (y | (x & 1) << 255).to_bytes(32, 'little')
+
+
+def _recover_x(y, sign):
+    x2 = (y * y - 1) * pow(_D * y * y + 1, _P - 2, _P)
+    x = pow(x2, (_P + 3) // 8, _P)
+    if (x * x - x2) % _P:
+        x = x * _SQRT_M1 % _P
+    if (x & 1) != sign:
+        x = _P - x
+    return x
+
+
+_GY = 4 * pow(5, _P - 2, _P) % _P
+_GX = _recover_x(_GY, 0)
+_G = (_GX, _GY, 1, _GX * _GY % _P)
+
+
+def _sha512_int(data):
+    return int.from_bytes(hashlib.sha512(data).digest(), 'little')
+
+
+def _expand_secret(secret):
+    h = hashlib.sha512(secret).digest()
+    a = int.from_bytes(h[:32], 'little')
+    a &= (1 << 254) - 8
+    a |= 1 << 254
+    return a, h[32:]
+
+
+def _ed25519_public_key_py(secret):
+    a, _ = _expand_secret(secret)
+    return _point_compress(_point_mul(a, _G))
+
+
+def _ed25519_sign_py(secret, message):
+    a, prefix = _expand_secret(secret)
+    public = _point_compress(_point_mul(a, _G))
+    r = _sha512_int(prefix + message) % _L
+    r_point = _point_compress(_point_mul(r, _G))
+    h = _sha512_int(r_point + public + message) % _L
+    return r_point + ((r + h * a) % _L).to_bytes(32, 'little')
+
+
+try:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+    def ed25519_public_key(secret):
+        return Ed25519PrivateKey.from_private_bytes(secret).public_key().public_bytes(
+            serialization.Encoding.Raw, serialization.PublicFormat.Raw
+        )
+
+    def ed25519_sign(secret, message):
+        return Ed25519PrivateKey.from_private_bytes(secret).sign(message)
+except ImportError:
+    ed25519_public_key = _ed25519_public_key_py
+    ed25519_sign = _ed25519_sign_py
+
+
+def blake2b256(data):
+    return hashlib.blake2b(data, digest_size=32).digest()
+
+
+# === Keys ===
+
+class Keypair:
+    """Ed25519 Sui keypair."""
+
+    def __init__(self, secret):
+        if len(secret) != 32:
+            raise ValueError("Invalid ed25519 secret key length")
+        self.secret = bytes(secret)
+        self.public_key = ed25519_public_key(self.secret)
+        self.address = '0x' + blake2b256(bytes([ED25519_FLAG]) + self.public_key).hex()
+
+    @classmethod
+    def from_env(cls, secret):
+        """Parse a key exactly like `loadKeypairFromEnv` in backend/src/server.js."""
+        raw = secret.strip()
+        if raw.startswith('suiprivkey1'):
+            _, data = bech32_decode(raw)
+            if len(data) < 33:
+                raise ValueError("Invalid suiprivkey1 payload length")
+            if data[0] != ED25519_FLAG:
+                raise ValueError("Unsupported key scheme in suiprivkey")
+            key = data[1:]
+            return cls(key[:32] if len(key) == 64 else key)
+
+        if raw.startswith('ed25519:'):
+            data = base64.b64decode(raw.split(':', 1)[1])
+            if len(data) == 33 and data[0] == ED25519_FLAG:
+                data = data[1:]
+            return cls(data[:32] if len(data) == 64 else data)
+
+        try:
+            data = bytes.fromhex(raw.removeprefix('0x'))
+        except ValueError:
+            data = b''
+        if len(data) == 64:
+            data = data[:32]
+        if len(data) != 32:
+            raise ValueError(
+                "SUI_PRIVATE_KEY must be 'suiprivkey1…', 'ed25519:<base64>', or 32/64 bytes hex"
+            )
+        return cls(data)
+
+    def to_suiprivkey(self):
+        return bech32_encode('suiprivkey', bytes([ED25519_FLAG]) + self.secret)
+
+    def sign_transaction(self, tx_bytes):
+        """Serialized Sui signature (base64 of flag || sig || pubkey) over `tx_bytes`."""
+        digest = blake2b256(TRANSACTION_INTENT + tx_bytes)
+        signature = ed25519_sign(self.secret, digest)
+        return base64.b64encode(bytes([ED25519_FLAG]) + signature + self.public_key).decode()
+
+
+# === Transaction encoding ===
+
+ObjectRef = namedtuple('ObjectRef', 'object_id version digest')
+SharedObject = namedtuple('SharedObject', 'object_id initial_shared_version mutable')
+
+PRIMITIVE_TYPE_TAGS = {
+    'bool': 0, 'u8': 1, 'u64': 2, 'u128': 3, 'address': 4, 'signer': 5,
+    'u16': 8, 'u32': 9, 'u256': 10,
+}
+
+
+def _split_type_args(text):
+    args, depth, start = [], 0, 0
+    for i, c in enumerate(text):
+        if c == '<':
+            depth += 1
+        elif c == '>':
+            depth -= 1
+        elif c == ',' and depth == 0:
+            args.append(text[start:i].strip())
+            start = i + 1
+    args.append(text[start:].strip())
+    return [a for a in args if a]
+
+
+def encode_type_tag(type_tag):
+    """BCS TypeTag for e.g. 'u64', 'vector<u8>' or '0x2::coin::Coin<0x2::sui::SUI>'."""
+    type_tag = type_tag.strip()
+    if type_tag in PRIMITIVE_TYPE_TAGS:
+        return u8(PRIMITIVE_TYPE_TAGS[type_tag])
+    if type_tag.startswith('vector<') and type_tag.endswith('>'):
+        return u8(6) + encode_type_tag(type_tag[7:-1])
+    base, _, params = type_tag.partition('<')
+    address, module, name = base.split('::')
+    type_params = _split_type_args(params[:-1]) if params else []
+    return (u8(7) + address_bytes(address) + bcs_str(module) + bcs_str(name)
+            + bcs_vec([encode_type_tag(p) for p in type_params]))
+
+
+def encode_object_ref(ref):
+    return address_bytes(ref.object_id) + u64(ref.version) + bcs_bytes(b58decode(ref.digest))
+
+
+def pure_arg(value_bytes):
+    return u8(0) + bcs_bytes(value_bytes)
+
+
+def object_arg(obj):
+    if isinstance(obj, SharedObject):
+        return (u8(1) + u8(1) + address_bytes(obj.object_id)
+                + u64(obj.initial_shared_version) + bcs_bool(obj.mutable))
+    return u8(1) + u8(0) + encode_object_ref(obj)
+
+
+def input_arg(index):
+    return u8(1) + u16(index)
+
+
+def move_call(package, module, function, type_arguments, arguments):
+    """Command::MoveCall; `arguments` are encoded Argument values."""
+    return (u8(0) + address_bytes(package) + bcs_str(module) + bcs_str(function)
+            + bcs_vec([encode_type_tag(t) for t in type_arguments]) + bcs_vec(arguments))
+
+
+def programmable_transaction(inputs, commands):
+    """TransactionKind::ProgrammableTransaction."""
+    return u8(0) + bcs_vec(inputs) + bcs_vec(commands)
+
+
+def gas_data(payment, owner, price, budget):
+    return bcs_vec([encode_object_ref(r) for r in payment]) + address_bytes(owner) + u64(price) + u64(budget)
+
+
+def transaction_data(kind, sender, payment, gas_price, gas_budget=DEFAULT_GAS_BUDGET, expiration_epoch=None):
+    """TransactionData::V1 bytes; gas is paid by `sender`."""
+    expiration = u8(0) if expiration_epoch is None else u8(1) + u64(expiration_epoch)
+    return (u8(0) + kind + address_bytes(sender)
+            + gas_data(payment, sender, gas_price, gas_budget) + expiration)
+
+
+def transaction_digest(tx_bytes):
+    return b58encode(blake2b256(b'TransactionData::' + tx_bytes))
+
+
+def _single_call(sender, payment, gas_price, gas_budget, package, module, function, type_args, inputs):
+    kind = programmable_transaction(
+        inputs, [move_call(package, module, function, type_args, [input_arg(i) for i in range(len(inputs))])]
+    )
+    return transaction_data(kind, sender, payment, gas_price, gas_budget)
+
+
+def faucet_create(sender, payment, gas_price, stablecoin_package, coin_type, treasury,
+                  gas_budget=DEFAULT_GAS_BUDGET):
+    """`faucet::create<T>(&Treasury<T>)`; `treasury` is a SharedObject (mutable=False)."""
+    return _single_call(sender, payment, gas_price, gas_budget, stablecoin_package,
+                        'faucet', 'create', [coin_type], [object_arg(treasury)])
+
+
+def faucet_request_for(sender, payment, gas_price, stablecoin_package, coin_type, faucet, treasury,
+                       recipient, amount, clock_version=CLOCK_INITIAL_SHARED_VERSION,
+                       gas_budget=DEFAULT_GAS_BUDGET):
+    """`faucet::request_for<T>(&mut Faucet, &mut Treasury, recipient, amount, &Clock)`."""
+    clock = SharedObject(SUI_CLOCK, clock_version, False)
+    return _single_call(sender, payment, gas_price, gas_budget, stablecoin_package,
+                        'faucet', 'request_for', [coin_type],
+                        [object_arg(faucet), object_arg(treasury), pure_arg(address_bytes(recipient)),
+                         pure_arg(u64(amount)), object_arg(clock)])
+
+
+class RequestForTemplate:
+    """Precomputed `faucet::request_for` encoding for building many transactions.
+
+    Output is byte-identical to faucet_request_for(); only the recipient,
+    amount and gas payment are encoded per transaction.
+    """
+
+    def __init__(self, sender, gas_price, stablecoin_package, coin_type, faucet, treasury,
+                 clock_version=CLOCK_INITIAL_SHARED_VERSION, gas_budget=DEFAULT_GAS_BUDGET):
+        clock = SharedObject(SUI_CLOCK, clock_version, False)
+        command = move_call(stablecoin_package, 'faucet', 'request_for', [coin_type],
+                            [input_arg(i) for i in range(5)])
+        # kind = 0x00 | 5 inputs | faucet | treasury | pure(recipient) | pure(amount) | clock | commands
+        self._head = u8(0) + u8(0) + uleb128(5) + object_arg(faucet) + object_arg(treasury) + u8(0) + uleb128(32)
+        self._mid = u8(0) + uleb128(8)
+        self._tail = object_arg(clock) + bcs_vec([command]) + address_bytes(sender)
+        self._gas_suffix = address_bytes(sender) + u64(gas_price) + u64(gas_budget) + u8(0)
+
+    def build(self, recipient, amount, payment):
+        return b''.join((
+            self._head, address_bytes(recipient), self._mid, u64(amount), self._tail,
+            bcs_vec([encode_object_ref(r) for r in payment]), self._gas_suffix,
+        ))
+
+    def build_many(self, requests):
+        """`requests` is an iterable of (recipient, amount, payment) tuples."""
+        return [self.build(recipient, amount, payment) for recipient, amount, payment in requests]
+
+
+def execute_transaction(rpc_url, tx_bytes, signature):
+    """Submit signed transaction bytes via JSON-RPC; returns the response JSON."""
+    body = json.dumps({
+        'jsonrpc': '2.0', 'id': 1, 'method': 'sui_executeTransactionBlock',
+        'params': [base64.b64encode(tx_bytes).decode(), [signature],
+                   {'showEffects': True, 'showObjectChanges': True}, 'WaitForLocalExecution'],
+    }).encode()
+    request = urllib.request.Request(rpc_url, data=body, headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(request, timeout=60) as response:
+        reply = json.loads(response.read())
+    if 'error' in reply:
+        raise RuntimeError(f"sui_executeTransactionBlock: {reply['error']}")
+    return reply['result']
+
+
+# === CLI ===
+
+def _shared(text, mutable):
+    object_id, _, version = text.partition(':')
+    if not version:
+        raise argparse.ArgumentTypeError("shared objects are given as <objectId>:<initialSharedVersion>")
+    return SharedObject(object_id, int(version), mutable)
+
+
+def _gas_ref(text):
+    parts = text.split(':')
+    if len(parts) != 3:
+        raise argparse.ArgumentTypeError("gas coins are given as <objectId>:<version>:<digest>")
+    return ObjectRef(parts[0], int(parts[1]), parts[2])
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Build and sign faucet transactions offline.')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def common(p):
+        p.add_argument('--key', required=True, help='signer key (suiprivkey1…, ed25519:<base64> or hex)')
+        p.add_argument('--stablecoin', required=True, help='stablecoin package ID')
+        p.add_argument('--coin-type', required=True, help='e.g. 0x…::usdc::USDC')
+        p.add_argument('--gas', required=True, type=_gas_ref, action='append',
+                       help='gas coin <objectId>:<version>:<digest> (repeatable)')
+        p.add_argument('--gas-price', required=True, type=int)
+        p.add_argument('--gas-budget', type=int, default=DEFAULT_GAS_BUDGET)
+        p.add_argument('--rpc', help='submit to this JSON-RPC URL instead of printing')
+
+    p = sub.add_parser('faucet-create')
+    common(p)
+    p.add_argument('--treasury', required=True, type=lambda t: _shared(t, False))
+
+    p = sub.add_parser('request-for')
+    common(p)
+    p.add_argument('--faucet', required=True, type=lambda t: _shared(t, True))
+    p.add_argument('--treasury', required=True, type=lambda t: _shared(t, True))
+    p.add_argument('--recipient', required=True)
+    p.add_argument('--amount', required=True, type=int)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    keypair = Keypair.from_env(args.key)
+    base = (keypair.address, args.gas, args.gas_price, args.stablecoin, args.coin_type)
+    if args.command == 'faucet-create':
+        tx_bytes = faucet_create(*base, args.treasury, gas_budget=args.gas_budget)
+    else:
+        tx_bytes = faucet_request_for(*base, args.faucet, args.treasury, args.recipient, args.amount,
+                                      gas_budget=args.gas_budget)
+
+    signature = keypair.sign_transaction(tx_bytes)
+    if args.rpc:
+        print(json.dumps(execute_transaction(args.rpc, tx_bytes, signature), indent=2))
+    else:
+        print(json.dumps({
+            'sender': keypair.address,
+            'digest': transaction_digest(tx_bytes),
+            'txBytes': base64.b64encode(tx_bytes).decode(),
+            'signature': signature,
+        }, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
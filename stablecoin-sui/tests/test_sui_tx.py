@@ -0,0 +1,175 @@
+"""
+Fixed vectors for sui_tx.py.
+
+The expected transaction bytes, digests, signatures, address and suiprivkey
+string below were produced independently of sui_tx.py with pysui 1.5.1: its
+BCS types (pysui.sui.sui_bcs.bcs.TransactionData etc.), its
+`digest_from_bytes`, and pysui-fastcrypto for keys and signatures.
+
+Run with `python3 -m unittest discover -s tests` (or `pytest tests`).
+"""
+
+import base64
+import json
+import sys
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import sui_tx  # noqa: E402
+from sui_tx import Keypair, ObjectRef, RequestForTemplate, SharedObject  # noqa: E402
+
+SECRET = bytes(range(1, 33))
+PUBLIC_KEY = '79b5562e8fe654f94078b112e8a98ba7901f853ae695bed7e0e3910bad049664'
+ADDRESS = '0x7573c697fa68450f04fa0dee2d39dcdc8a5ccf5db547f3e47638a6f8eeeec110'
+SUIPRIVKEY = 'suiprivkey1qqqsyqcyq5rqwzqfpg9scrgwpugpzysnzs23v9ccrydpk8qarc0jqa4ffsr'
+
+STABLECOIN = '0x' + 'ab' * 32
+COIN_TYPE = '0x' + 'cd' * 32 + '::usdc::USDC'
+FAUCET_ID = '0x' + '11' * 32
+TREASURY_ID = '0x' + '22' * 32
+RECIPIENT = '0x' + '33' * 32
+GAS = [ObjectRef('0x' + '44' * 32, 34, '7kuT1dfMhUysWcLEV1eYk8ir7RTjszHmsUdrrPQNThcv')]
+GAS_PRICE = 1000
+AMOUNT = 50_000_000
+
+FAUCET_CREATE_TX = (
+    'AAABAQEiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIgsAAAAAAAAAAAEAq6urq6urq6urq6urq6urq6urq6urq6urq6ur'
+    'q6urq6sGZmF1Y2V0BmNyZWF0ZQEHzc3Nzc3Nzc3Nzc3Nzc3Nzc3Nzc3Nzc3Nzc3Nzc3Nzc0EdXNkYwRVU0RDAAEBAAB1c8aX+mhF'
+    'DwT6De4tOdzcilzPXbVH8+R2OKb47u7BEAFERERERERERERERERERERERERERERERERERERERERERCIAAAAAAAAAIGRlZmdoaWpr'
+    'bG1ub3BxcnN0dXZ3eHl6e3x9fn+AgYKDdXPGl/poRQ8E+g3uLTnc3Ipcz121R/Pkdjim+O7uwRDoAwAAAAAAAICWmAAAAAAAAA=='
+)
+FAUCET_CREATE_DIGEST = 'HnbyF7mdWF1v44tU4iC8MBmfxN3d61WmSTchB17R4hmD'
+FAUCET_CREATE_SIGNATURE = (
+    'AHpmaaxHt1BSQAKx33mmtYeu+7o/FiVnb1sVrTLLsyrAL1hJQBchawHjwdHlX9Hucd15ALiV5V3tYg01hJvGmQd5tVYuj+ZU+UB4'
+    'sRLoqYunkB+FOuaVvtfg45ELrQSWZA=='
+)
+
+REQUEST_FOR_TX = (
+    'AAAFAQEREREREREREREREREREREREREREREREREREREREREREQwAAAAAAAAAAQEBIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIi'
+    'IiIiIiILAAAAAAAAAAEAIDMzMzMzMzMzMzMzMzMzMzMzMzMzMzMzMzMzMzMzMzMzAAiA8PoCAAAAAAEBAAAAAAAAAAAAAAAAAAAA'
+    'AAAAAAAAAAAAAAAAAAAAAAYBAAAAAAAAAAABAKurq6urq6urq6urq6urq6urq6urq6urq6urq6urq6urBmZhdWNldAtyZXF1ZXN0'
+    'X2ZvcgEHzc3Nzc3Nzc3Nzc3Nzc3Nzc3Nzc3Nzc3Nzc3Nzc3Nzc0EdXNkYwRVU0RDAAUBAAABAQABAgABAwABBAB1c8aX+mhFDwT6'
+    'De4tOdzcilzPXbVH8+R2OKb47u7BEAFERERERERERERERERERERERERERERERERERERERERERCIAAAAAAAAAIGRlZmdoaWprbG1u'
+    'b3BxcnN0dXZ3eHl6e3x9fn+AgYKDdXPGl/poRQ8E+g3uLTnc3Ipcz121R/Pkdjim+O7uwRDoAwAAAAAAAICWmAAAAAAAAA=='
+)
+REQUEST_FOR_DIGEST = '8cFZPbGMgbyT2Kb9UvQukKS972Smy6TCp31JsF7EtbFz'
+REQUEST_FOR_SIGNATURE = (
+    'AE5NRl5mFvnSW0I/s+mkEeZBGQxKICOq2ZvRQ0lr6XuWd/WUoCA6KciQIsoYqfFl/QXGv7rvR2U6jHIC7vUAsgN5tVYuj+ZU+UB4'
+    'sRLoqYunkB+FOuaVvtfg45ELrQSWZA=='
+)
+
+
+def build_faucet_create():
+    return sui_tx.faucet_create(ADDRESS, GAS, GAS_PRICE, STABLECOIN, COIN_TYPE,
+                                SharedObject(TREASURY_ID, 11, False))
+
+
+def build_request_for(recipient=RECIPIENT, amount=AMOUNT, payment=GAS):
+    return sui_tx.faucet_request_for(ADDRESS, payment, GAS_PRICE, STABLECOIN, COIN_TYPE,
+                                     SharedObject(FAUCET_ID, 12, True), SharedObject(TREASURY_ID, 11, True),
+                                     recipient, amount)
+
+
+class KeyFormatTests(unittest.TestCase):
+
+    def test_address_and_public_key(self):
+        keypair = Keypair(SECRET)
+        self.assertEqual(keypair.public_key.hex(), PUBLIC_KEY)
+        self.assertEqual(keypair.address, ADDRESS)
+
+    def test_suiprivkey_round_trip(self):
+        self.assertEqual(Keypair(SECRET).to_suiprivkey(), SUIPRIVKEY)
+        self.assertEqual(Keypair.from_env(SUIPRIVKEY).secret, SECRET)
+
+    def test_all_formats_parse_to_the_same_key(self):
+        formats = [
+            SUIPRIVKEY,
+            'ed25519:' + base64.b64encode(bytes([sui_tx.ED25519_FLAG]) + SECRET).decode(),
+            'ed25519:' + base64.b64encode(SECRET).decode(),
+            SECRET.hex(),
+            '0x' + SECRET.hex(),
+            '0x' + SECRET.hex() + PUBLIC_KEY,
+            f'  {SUIPRIVKEY}\n',
+        ]
+        for text in formats:
+            with self.subTest(text=text):
+                keypair = Keypair.from_env(text)
+                self.assertEqual(keypair.address, ADDRESS)
+                self.assertEqual(Keypair.from_env(keypair.to_suiprivkey()).secret, SECRET)
+
+    def test_invalid_keys_are_rejected(self):
+        secp256k1 = sui_tx.bech32_encode('suiprivkey', bytes([1]) + SECRET)
+        for text in ['', '0x1234', 'not-a-key', secp256k1, SUIPRIVKEY[:-1] + 'q']:
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                Keypair.from_env(text)
+
+
+class TransactionVectorTests(unittest.TestCase):
+
+    def test_faucet_create(self):
+        tx_bytes = build_faucet_create()
+        self.assertEqual(base64.b64encode(tx_bytes).decode(), FAUCET_CREATE_TX)
+        self.assertEqual(sui_tx.transaction_digest(tx_bytes), FAUCET_CREATE_DIGEST)
+        self.assertEqual(Keypair(SECRET).sign_transaction(tx_bytes), FAUCET_CREATE_SIGNATURE)
+
+    def test_request_for(self):
+        tx_bytes = build_request_for()
+        self.assertEqual(base64.b64encode(tx_bytes).decode(), REQUEST_FOR_TX)
+        self.assertEqual(sui_tx.transaction_digest(tx_bytes), REQUEST_FOR_DIGEST)
+        self.assertEqual(Keypair(SECRET).sign_transaction(tx_bytes), REQUEST_FOR_SIGNATURE)
+
+    def test_pure_python_signer_matches(self):
+        # Exercised whether or not `cryptography` is installed
+        tx_bytes = base64.b64decode(REQUEST_FOR_TX)
+        message = sui_tx.blake2b256(sui_tx.TRANSACTION_INTENT + tx_bytes)
+        signature = base64.b64decode(REQUEST_FOR_SIGNATURE)
+        self.assertEqual(sui_tx._ed25519_public_key_py(SECRET).hex(), PUBLIC_KEY)
+        self.assertEqual(sui_tx._ed25519_sign_py(SECRET, message), signature[1:65])
+
+    def test_cli_request_for(self):
+        out = StringIO()
+        with redirect_stdout(out):
+            sui_tx.main([
+                'request-for', '--key', SUIPRIVKEY, '--stablecoin', STABLECOIN, '--coin-type', COIN_TYPE,
+                '--gas', ':'.join(str(part) for part in GAS[0]), '--gas-price', str(GAS_PRICE),
+                '--faucet', f'{FAUCET_ID}:12', '--treasury', f'{TREASURY_ID}:11',
+                '--recipient', RECIPIENT, '--amount', str(AMOUNT),
+            ])
+        self.assertEqual(json.loads(out.getvalue()), {
+            'sender': ADDRESS,
+            'digest': REQUEST_FOR_DIGEST,
+            'txBytes': REQUEST_FOR_TX,
+            'signature': REQUEST_FOR_SIGNATURE,
+        })
+
+
+class RequestForTemplateTests(unittest.TestCase):
+
+    def setUp(self):
+        self.template = RequestForTemplate(ADDRESS, GAS_PRICE, STABLECOIN, COIN_TYPE,
+                                           SharedObject(FAUCET_ID, 12, True), SharedObject(TREASURY_ID, 11, True))
+
+    def test_matches_vector(self):
+        self.assertEqual(base64.b64encode(self.template.build(RECIPIENT, AMOUNT, GAS)).decode(), REQUEST_FOR_TX)
+
+    def test_matches_faucet_request_for(self):
+        two_coins = GAS + [ObjectRef('0x5', 2**40, FAUCET_CREATE_DIGEST)]
+        requests = [
+            (RECIPIENT, AMOUNT, GAS),
+            ('0x2', 1, GAS),
+            ('0x' + 'ff' * 32, 2**64 - 1, two_coins),
+            (ADDRESS, 0, []),
+        ]
+        built = self.template.build_many(requests)
+        self.assertEqual(len(built), len(requests))
+        for tx_bytes, (recipient, amount, payment) in zip(built, requests):
+            with self.subTest(recipient=recipient, amount=amount):
+                self.assertEqual(tx_bytes, build_request_for(recipient, amount, payment))
+
+
+if __name__ == '__main__':
+    unittest.main()